@@ -219,6 +219,85 @@ def add_lap_time(rig_identifier, track_name, player_name, lap_time_ms):
         conn.close()
 
 
+def bulk_add_lap_times(rows, conn=None):
+    """
+    Add many lap times to the database in a single transaction.
+
+    Rows for unknown tracks/rigs and exact duplicates are skipped, as in add_lap_time.
+
+    Args:
+        rows (list): (rig_identifier, track_name, player_name, lap_time_ms) tuples
+        conn (sqlite3.Connection, optional): Connection to reuse; left open for the caller
+
+    Returns:
+        list: The rows that were inserted (empty if the transaction failed)
+    """
+    own_conn = conn is None
+    if own_conn:
+        conn = get_db_connection()
+
+    try:
+        track_ids = {row['name']: row['id'] for row in conn.execute("SELECT id, name FROM tracks")}
+        rig_ids = {row['rig_identifier']: row['id'] for row in conn.execute("SELECT id, rig_identifier FROM rigs")}
+        timestamp = datetime.now().isoformat()
+        wanted_tracks = {track_ids[row[1]] for row in rows if row[1] in track_ids}
+        placeholders = ", ".join("?" * len(wanted_tracks))
+        existing = {
+            (row['track_id'], row['player_name_on_lap'], row['lap_time_ms'])
+            for row in conn.execute(
+                f"SELECT track_id, player_name_on_lap, lap_time_ms FROM lap_times WHERE track_id IN ({placeholders})",
+                tuple(wanted_tracks)
+            )
+        }
+
+        inserted = []
+        params = []
+        for rig_identifier, track_name, player_name, lap_time_ms in rows:
+            track_id = track_ids.get(track_name)
+            rig_id = rig_ids.get(rig_identifier)
+
+            if not track_id:
+                logger.error(f"Track not found: {track_name}")
+                continue
+
+            if not rig_id:
+                logger.error(f"Rig not found: {rig_identifier}")
+                continue
+
+            # Skip laps already stored (or repeated earlier in this batch)
+            key = (track_id, player_name, lap_time_ms)
+            if key in existing:
+                logger.info(f"Duplicate lap time detected: {player_name} - {track_name} - {lap_time_ms}ms, skipping")
+                continue
+            existing.add(key)
+
+            params.append((rig_id, track_id, player_name, lap_time_ms, timestamp))
+            inserted.append((rig_identifier, track_name, player_name, lap_time_ms))
+
+        # One prepared INSERT bound once per row, inside a single transaction
+        conn.execute("BEGIN")
+        conn.executemany(
+            """
+            INSERT INTO lap_times
+            (rig_id, track_id, player_name_on_lap, lap_time_ms, timestamp)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            params
+        )
+        conn.commit()
+        logger.info(f"Added {len(inserted)} of {len(rows)} lap times")
+        return inserted
+
+    except Exception as e:
+        conn.rollback()
+        logger.error(f"Error adding lap times: {e}")
+        return []
+
+    finally:
+        if own_conn:
+            conn.close()
+
+
 def get_top_lap_times(track_name, limit=20):
     """
     Get the top lap times for a specific track.
@@ -291,7 +370,7 @@ def get_top_lap_times(track_name, limit=20):
         conn.close()
 
 
-def assign_player_to_rig(rig_identifier, player_name, phone_number="", email=""):
+def assign_player_to_rig(rig_identifier, player_name, phone_number="", email="", conn=None):
     """
     Assign a player to a simulator rig.
     
@@ -300,17 +379,23 @@ def assign_player_to_rig(rig_identifier, player_name, phone_number="", email="")
         player_name (str): Name of the player to assign
         phone_number (str, optional): Phone number of the player
         email (str, optional): Email address of the player
+        conn (sqlite3.Connection, optional): Connection to reuse; the caller commits and closes it
         
     Returns:
         bool: True if successful, False otherwise
     """
-    conn = get_db_connection()
+    own_conn = conn is None
+    if own_conn:
+        conn = get_db_connection()
     
     try:
         # Check if rig exists
-        rig_id = get_rig_id(rig_identifier)
+        rig = conn.execute(
+            "SELECT id FROM rigs WHERE rig_identifier = ?",
+            (rig_identifier,)
+        ).fetchone()
         
-        if not rig_id:
+        if not rig:
             logger.error(f"Rig not found: {rig_identifier}")
             return False
         
@@ -320,17 +405,20 @@ def assign_player_to_rig(rig_identifier, player_name, phone_number="", email="")
             (player_name, phone_number, email, rig_identifier)
         )
         
-        conn.commit()
+        if own_conn:
+            conn.commit()
         logger.info(f"Assigned player '{player_name}' to rig '{rig_identifier}' with contact info")
         return True
     
     except Exception as e:
-        conn.rollback()
+        if own_conn:
+            conn.rollback()
         logger.error(f"Error assigning player to rig: {e}")
         return False
     
     finally:
-        conn.close()
+        if own_conn:
+            conn.close()
 
 
 def get_rig_assignments():
@@ -76,6 +76,12 @@ class LapTimeSubmit(BaseModel):
     track_name: str = Field(..., description="Name of the F1 track")
     lap_time_ms: int = Field(..., description="Lap time in milliseconds", gt=0)
 
+class LapTimeBatchSubmit(BaseModel):
+    """
+    Model for submitting several lap times in one request.
+    """
+    submissions: List[LapTimeSubmit] = Field(..., description="Lap times to submit")
+
 class LapTimeDisplay(BaseModel):
     """
     Model for lap time display data.
@@ -296,6 +302,56 @@ async def submit_lap_time(lap_data: LapTimeSubmit):
         logger.error(f"Error submitting lap time: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/api/laptime/batch", tags=["Lap Times"])
+async def submit_lap_times_batch(batch: LapTimeBatchSubmit):
+    """
+    Submit several lap times in one request.
+    
+    Args:
+        batch: Lap time submissions
+        
+    Returns:
+        dict: Overall success, summary message and per-submission results
+    """
+    try:
+        player_names = {}  # Look up each rig's current player once per batch
+        results = []
+        
+        for lap_data in batch.submissions:
+            rig_identifier = lap_data.rig_identifier
+            if rig_identifier not in player_names:
+                player_names[rig_identifier] = get_rig_current_player(rig_identifier)
+            player_name = player_names[rig_identifier]
+            
+            # Anonymous players' lap times are acknowledged but not saved
+            if player_name.lower() == "null":
+                logger.info(f"Lap time ignored for anonymous player on rig {rig_identifier}")
+                success = True
+            else:
+                success = add_lap_time(
+                    rig_identifier,
+                    lap_data.track_name,
+                    player_name,
+                    lap_data.lap_time_ms
+                )
+            
+            results.append({
+                "success": success,
+                "lap_time_ms": lap_data.lap_time_ms,
+                "formatted_time": format_lap_time(lap_data.lap_time_ms)
+            })
+        
+        succeeded = sum(1 for result in results if result["success"])
+        return {
+            "success": succeeded == len(results),
+            "message": f"{succeeded}/{len(results)} lap times processed",
+            "results": results
+        }
+    
+    except Exception as e:
+        logger.error(f"Error submitting lap times: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.get("/api/leaderboard/{track_name}", response_model=List[LapTimeDisplay], tags=["Leaderboard"])
 async def get_leaderboard(
     track_name: str = Path(..., description="Name of the F1 track"),
@@ -88,8 +88,20 @@ TRACK_ID_MAPPING = {
     "Yas Marina Circuit": 14                   # abu_dhabi
 }
 
-# Path to the telemetry repository - check multiple possible locations
-TELEMETRY_REPO_PATH = "C:/Users/landg/Desktop/f1-24-app/f1-24-telemetry-application"
+# Path to the telemetry repository - check multiple possible locations.
+# The F1_TELEMETRY_REPO environment variable, if set, takes precedence.
+_POSSIBLE_TELEMETRY_PATHS = (
+    os.environ.get("F1_TELEMETRY_REPO"),
+    "C:/Users/landg/Desktop/f1-24-app/f1-24-telemetry-application",
+    os.path.join(os.path.dirname(__file__), "..", "..", "f1-24-telemetry-application"),  # Git submodule
+    "/opt/f1-24-telemetry",
+)
+
+# Resolved once at import time; falls back to the original path so listeners can report it
+TELEMETRY_REPO_PATH = next(
+    (os.path.abspath(p) for p in _POSSIBLE_TELEMETRY_PATHS if p and os.path.isdir(p)),
+    "C:/Users/landg/Desktop/f1-24-app/f1-24-telemetry-application"
+)
 
 DATABASE_URL = "backend/database/f1_leaderboard.db"
 API_PORT = 8000
@@ -102,6 +114,9 @@ DEFAULT_RIG_NAMES = {
     "RIG4": "Simulator 4" # Added RIG4
 }
 DEFAULT_UDP_PORT = 20777
+# Read session/lap data straight from the UDP bytes instead of building the
+# telemetry repository's packet objects (set to False to use its parser)
+FAST_PACKET_PARSING = True
 
 # --- Network Configuration Profiles ---
 SHOP_NETWORK_CONFIG = {
@@ -0,0 +1,47 @@
+"""
+F1 Leaderboard Application - Shared Helpers
+
+Small helpers used by the listeners, the Supabase sync and the timer client.
+The standalone copies in rig_installer/ keep their own versions because they
+run without the rest of the project.
+"""
+
+import functools
+import json
+
+# orjson is optional and much faster; fall back to the standard library encoder
+try:
+    import orjson
+    json_dumps = orjson.dumps
+except ImportError:
+    def json_dumps(obj):
+        """Encode an object as JSON bytes.
+
+        Args:
+            obj: JSON-serializable object
+
+        Returns:
+            bytes: UTF-8 encoded JSON
+        """
+        return json.dumps(obj).encode()
+
+@functools.lru_cache(maxsize=4096)
+def format_lap_time(milliseconds):
+    """Format lap time from milliseconds to MM:SS.mmm using integer arithmetic only.
+
+    Cached because the same lap time is formatted several times: for the lap
+    report, the personal-best message and the submission log, and for tied
+    laps across a full leaderboard sync.
+
+    Args:
+        milliseconds (int): Lap time in milliseconds
+
+    Returns:
+        str: Formatted lap time as MM:SS.mmm
+    """
+    if not milliseconds or milliseconds <= 0:
+        return "00:00.000"
+
+    minutes, remainder = divmod(int(milliseconds), 60000)
+    seconds, milliseconds = divmod(remainder, 1000)
+    return f"{minutes:02d}:{seconds:02d}.{milliseconds:03d}"
@@ -18,18 +18,26 @@ $ python listeners/basic_listener.py
 
 import os
 import sys
+import socket
+import struct
 import time
 import logging
+import threading
+import collections
 from datetime import datetime
 
 # Add the project root to the Python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Import app configuration
-from config.app_config import TELEMETRY_REPO_PATH, TRACK_ID_MAPPING, F1_2024_TRACKS
+from config.app_config import (
+    TELEMETRY_REPO_PATH, TRACK_ID_MAPPING, F1_2024_TRACKS, FAST_PACKET_PARSING
+)
+from config.utils import format_lap_time
 
-# Add the telemetry repository to the Python path
-sys.path.append(TELEMETRY_REPO_PATH)
+# Add the telemetry repository to the Python path (once)
+if TELEMETRY_REPO_PATH not in sys.path:
+    sys.path.append(TELEMETRY_REPO_PATH)
 
 # Import telemetry components
 try:
@@ -55,9 +63,42 @@ logger = logging.getLogger(__name__)
 # Reverse track dictionary mapping (ID to name)
 TRACK_ID_TO_NAME = {v: k for k, v in TRACK_ID_MAPPING.items()}
 
+# F1 2024 UDP packet layout (little-endian, packed) used by the fast parsing path
+PACKET_HEADER_SIZE = 29
+# Header m_packetFormat (game year); the offsets below are only valid for 2024
+_PACKET_FORMAT = struct.Struct("<H")
+PACKET_FORMAT_2024 = 2024
+PACKET_ID_OFFSET = 6
+PLAYER_CAR_INDEX_OFFSET = 27
+NUM_CARS = 22
+# Session packet: m_trackId follows weather, temperatures, total laps, track length and session type
+_SESSION_TRACK_ID = struct.Struct("<b")
+SESSION_TRACK_ID_OFFSET = PACKET_HEADER_SIZE + 7
+# LapData entry: m_lastLapTimeInMS, m_currentLapTimeInMS, (sector/delta times, distances),
+# m_carPosition, m_currentLapNum, (pit status, pit stops, sector), m_currentLapInvalid
+_LAP_ENTRY = struct.Struct("<II24xBB3xB")
+LAP_ENTRY_SIZE = 57
+LAP_DATA_PACKET_MIN_SIZE = PACKET_HEADER_SIZE + NUM_CARS * LAP_ENTRY_SIZE
+
+# Kernel receive buffer for the UDP socket, absorbs bursts while we're busy
+UDP_RECV_BUFFER_BYTES = 4 << 20
+# Receive thread pacing: wait after an unexpected error, and when the parser returns nothing
+RECV_ERROR_BACKOFF = 0.5  # seconds
+RECV_IDLE_SLEEP = 0.001  # seconds
+
 class TelemetryListener:
     """Basic telemetry listener for F1 2024 game data."""
     
+    # Lap completion report, emitted as a single log record
+    LAP_COMPLETED_MESSAGE = "\n".join([
+        "New Lap Completed - %s (Index: %d)",
+        "  Track: %s",
+        "  Lap Time: %s",
+        "  Position: %d",
+        "  Current Lap: %d",
+        "",
+    ])
+    
     def __init__(self, port=20777):
         """Initialize the telemetry listener.
         
@@ -70,17 +111,47 @@ class TelemetryListener:
         self.session = Session()
         self.last_lap_times = [0] * 22  # Store previous lap times to detect changes
         self.running = False
+        # Packets handed over from the receive thread; oldest are dropped if we fall behind
+        self._queue = collections.deque(maxlen=256)
+        # Released once per queued packet so the main loop can block instead of polling
+        self._queued = threading.Semaphore(0)
+        self._recv_thread = None
+        self._socket = None  # Raw UDP socket, set when fast packet parsing is used
         
     def initialize(self):
         """Initialize the UDP listener."""
         try:
             logger.info(f"Initializing UDP listener on port {self.port}")
             self.listener = Listener(port=self.port)
+            
+            sock = getattr(self.listener, "socket", None)
+            if sock is not None:
+                self._set_receive_buffer(sock)
+            
+            if FAST_PACKET_PARSING:
+                self._socket = sock
+                if self._socket is None:
+                    logger.warning("Listener socket not accessible, falling back to the telemetry parser")
             return True
         except Exception as e:
             logger.error(f"Failed to initialize listener: {e}")
             return False
     
+    def _set_receive_buffer(self, sock):
+        """Enlarge the UDP receive buffer and warn if the kernel caps it.
+        
+        Args:
+            sock (socket.socket): The listener's UDP socket
+        """
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, UDP_RECV_BUFFER_BYTES)
+            granted = sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)
+            if granted < UDP_RECV_BUFFER_BYTES:
+                logger.warning(f"UDP receive buffer is {granted} bytes, requested {UDP_RECV_BUFFER_BYTES}; "
+                               f"raise net.core.rmem_max to avoid drops during bursts")
+        except OSError as e:
+            logger.warning(f"Could not set UDP receive buffer size: {e}")
+    
     def get_track_name(self, track_id):
         """Get the human-readable track name from the track ID.
         
@@ -91,14 +162,12 @@ class TelemetryListener:
             str: Human-readable track name or 'Unknown Track' if not found
         """
         if track_id in track_dictionary:
-            internal_name = track_dictionary[track_id][0]
-            
-            # Try to map internal name to official name
-            for official_name, tid in TRACK_ID_MAPPING.items():
-                if tid == track_id:
-                    return official_name
+            # Try to map the track ID to its official name
+            official_name = TRACK_ID_TO_NAME.get(track_id)
+            if official_name:
+                return official_name
             
-            return f"Track: {internal_name}"
+            return f"Track: {track_dictionary[track_id][0]}"
         
         return f"Unknown Track (ID: {track_id})"
     
@@ -111,15 +180,7 @@ class TelemetryListener:
         Returns:
             str: Formatted lap time as MM:SS.mmm
         """
-        if milliseconds == 0:
-            return "00:00.000"
-        
-        total_seconds = milliseconds / 1000
-        minutes = int(total_seconds // 60)
-        seconds = int(total_seconds % 60)
-        milliseconds = int((total_seconds - int(total_seconds)) * 1000)
-        
-        return f"{minutes:02d}:{seconds:02d}.{milliseconds:03d}"
+        return format_lap_time(milliseconds)
     
     def process_lap_data(self, packet, player_car_index):
         """Process lap data packet and print new lap times.
@@ -128,43 +189,77 @@ class TelemetryListener:
             packet: The LapData packet
             player_car_index (int): Index of the player's car
         """
-        for i in range(len(packet.m_lap_data)):
-            lap_data = packet.m_lap_data[i]
+        entries = (
+            (lap_data.m_last_lap_time_in_ms, lap_data.m_current_lap_time_in_ms,
+             lap_data.m_car_position, lap_data.m_current_lap_num, lap_data.m_current_lap_invalid)
+            for lap_data in packet.m_lap_data
+        )
+        self._process_lap_entries(entries, player_car_index)
+    
+    def process_lap_data_raw(self, data, player_car_index):
+        """Process a raw LapData packet without going through the telemetry parser.
+        
+        Args:
+            data (bytes): The full UDP datagram, header included
+            player_car_index (int): Index of the player's car
+        """
+        if len(data) < LAP_DATA_PACKET_MIN_SIZE:
+            logger.debug(f"Ignoring short lap data packet ({len(data)} bytes)")
+            return
+        
+        entries = (
+            _LAP_ENTRY.unpack_from(data, PACKET_HEADER_SIZE + i * LAP_ENTRY_SIZE)
+            for i in range(NUM_CARS)
+        )
+        self._process_lap_entries(entries, player_car_index)
+    
+    def _process_lap_entries(self, entries, player_car_index):
+        """Detect and print newly completed laps.
+        
+        Args:
+            entries: Iterable of (last_lap_time, current_lap_time, car_position,
+                current_lap_num, current_lap_invalid) tuples, one per car
+            player_car_index (int): Index of the player's car
+        """
+        entries = list(entries)
+        last_lap_times = self.last_lap_times
+        
+        # Pick out the cars whose last lap time changed in this packet (usually none),
+        # so the per-car work below only runs for actual lap completions
+        completed = [
+            i for i, entry in enumerate(entries)
+            if entry[0] != 0 and entry[0] != last_lap_times[i]
+        ]
+        
+        for i in completed:
+            last_lap_time, _, car_position, current_lap_num, current_lap_invalid = entries[i]
             player = self.players[i]
             
-            # Update player lap times
-            current_lap_time = lap_data.m_current_lap_time_in_ms
-            last_lap_time = lap_data.m_last_lap_time_in_ms
-            
             # Store the last lap time
+            last_lap_times[i] = last_lap_time
             player.lastLapTime = last_lap_time
-            player.currentLapTime = current_lap_time
             
-            # Check if this is a new completed lap
-            if last_lap_time != 0 and last_lap_time != self.last_lap_times[i]:
-                self.last_lap_times[i] = last_lap_time
-                
-                # Only print lap times for valid laps
-                if not lap_data.m_current_lap_invalid:
-                    formatted_time = self.format_lap_time(last_lap_time)
-                    
-                    # Check if this is the player's car
-                    car_type = "Player Car" if i == player_car_index else "AI Car"
-                    
-                    # Print lap information
-                    logger.info(
-                        f"New Lap Completed - {car_type} (Index: {i})\n"
-                        f"  Track: {self.get_track_name(self.session.track)}\n"
-                        f"  Lap Time: {formatted_time}\n"
-                        f"  Position: {lap_data.m_car_position}\n"
-                        f"  Current Lap: {lap_data.m_current_lap_num}\n"
-                    )
-                    
-                    # Update best lap time if applicable
-                    if player.bestLapTime > last_lap_time or player.bestLapTime == 0:
-                        player.bestLapTime = last_lap_time
-                        formatted_best = self.format_lap_time(player.bestLapTime)
-                        logger.info(f"  New Personal Best: {formatted_best}")
+            # Only print lap times for valid laps
+            if current_lap_invalid:
+                continue
+            
+            formatted_time = format_lap_time(last_lap_time)
+            
+            # Check if this is the player's car
+            car_type = "Player Car" if i == player_car_index else "AI Car"
+            
+            # Print lap information
+            logger.info(
+                self.LAP_COMPLETED_MESSAGE,
+                car_type, i, self.get_track_name(self.session.track),
+                formatted_time, car_position, current_lap_num
+            )
+            
+            # Update best lap time if applicable
+            if player.bestLapTime > last_lap_time or player.bestLapTime == 0:
+                player.bestLapTime = last_lap_time
+                formatted_best = format_lap_time(player.bestLapTime)
+                logger.info(f"  New Personal Best: {formatted_best}")
     
     def process_session_data(self, packet):
         """Process session data packet to update track information.
@@ -172,10 +267,31 @@ class TelemetryListener:
         Args:
             packet: The SessionData packet
         """
+        self.update_track(packet.m_track_id)
+    
+    def process_session_data_raw(self, data):
+        """Process a raw SessionData packet without going through the telemetry parser.
+        
+        Args:
+            data (bytes): The full UDP datagram, header included
+        """
+        if len(data) <= SESSION_TRACK_ID_OFFSET:
+            logger.debug(f"Ignoring short session data packet ({len(data)} bytes)")
+            return
+        
+        track_id, = _SESSION_TRACK_ID.unpack_from(data, SESSION_TRACK_ID_OFFSET)
+        self.update_track(track_id)
+    
+    def update_track(self, track_id):
+        """Update the current track, resetting lap times if it changed.
+        
+        Args:
+            track_id (int): Track ID from telemetry
+        """
         # Update track ID if changed
-        if self.session.track != packet.m_track_id:
+        if self.session.track != track_id:
             old_track = self.get_track_name(self.session.track) if self.session.track != -1 else "None"
-            self.session.track = packet.m_track_id
+            self.session.track = track_id
             new_track = self.get_track_name(self.session.track)
             
             logger.info(f"Track changed: {old_track} -> {new_track}")
@@ -186,45 +302,117 @@ class TelemetryListener:
                 player.bestLapTime = 0
                 player.lastLapTime = 0
     
+    def _recv_loop(self):
+        """Receive packets on a background thread and queue them for processing.
+
+        Keeping the socket read separate from parsing/processing lets the kernel
+        receive overlap with the Python work done on the main thread.
+        """
+        while self.running:
+            try:
+                if self._socket is not None:
+                    # Fast path: queue the raw datagram, it is decoded on the main thread
+                    self._queue.append(self._socket.recv(2048))
+                    self._queued.release()
+                    continue
+                
+                header_and_packet = self.listener.get()
+            except socket.timeout:
+                continue
+            except OSError as e:
+                # The socket is closed or broken, retrying would only spin; stop the
+                # listener as a receive error did before receiving moved to this thread
+                if self.running:
+                    logger.error(f"Telemetry socket error, stopping listener: {e}")
+                    self.running = False
+                break
+            except Exception as e:
+                if self.running:
+                    logger.error(f"Error receiving telemetry packet: {e}")
+                time.sleep(RECV_ERROR_BACKOFF)
+                continue
+            
+            if header_and_packet:
+                self._queue.append(header_and_packet)
+                self._queued.release()
+            else:
+                # Nothing received, don't spin on the parser
+                time.sleep(RECV_IDLE_SLEEP)
+    
+    def process_raw_packet(self, data):
+        """Dispatch a raw UDP datagram by packet ID (fast parsing path).
+        
+        Args:
+            data (bytes): The full UDP datagram, header included
+        """
+        if len(data) < PACKET_HEADER_SIZE:
+            return
+        
+        # Other game years lay packets out differently; drop them rather than mis-decode
+        if _PACKET_FORMAT.unpack_from(data)[0] != PACKET_FORMAT_2024:
+            return
+        
+        packet_id = data[PACKET_ID_OFFSET]
+        
+        if packet_id == 1:  # Session data (includes track info)
+            self.process_session_data_raw(data)
+        
+        elif packet_id == 2:  # Lap data
+            self.process_lap_data_raw(data, data[PLAYER_CAR_INDEX_OFFSET])
+    
     def run(self):
         """Main loop to capture and process telemetry data."""
         if not self.initialize():
             return False
         
         self.running = True
+        self._recv_thread = threading.Thread(target=self._recv_loop, daemon=True)
+        self._recv_thread.start()
         logger.info("Telemetry listener started. Waiting for F1 2024 telemetry data...")
         logger.info("Press Ctrl+C to stop.")
         
         try:
             while self.running:
-                # Get packet from the listener
-                header_and_packet = self.listener.get()
+                # Sleep until the receive thread queues a packet (timeout keeps Ctrl+C responsive)
+                if not self._queued.acquire(timeout=0.1):
+                    continue
+                
+                try:
+                    item = self._queue.popleft()
+                except IndexError:
+                    # Packet was dropped from the full queue, the semaphore count ran ahead
+                    continue
+                
+                if self._socket is not None:
+                    self.process_raw_packet(item)
+                    continue
                 
-                if header_and_packet:
-                    header, packet = header_and_packet
-                    
-                    # Get player car index
-                    player_car_index = header.m_player_car_index
-                    
-                    # Process different packet types
-                    if header.m_packet_id == 1:  # Session data (includes track info)
-                        self.process_session_data(packet)
-                    
-                    elif header.m_packet_id == 2:  # Lap data
-                        self.process_lap_data(packet, player_car_index)
+                header, packet = item
                 
-                # Small sleep to prevent high CPU usage
-                time.sleep(0.001)
+                # Get player car index
+                player_car_index = header.m_player_car_index
+                
+                # Process different packet types
+                if header.m_packet_id == 1:  # Session data (includes track info)
+                    self.process_session_data(packet)
+                
+                elif header.m_packet_id == 2:  # Lap data
+                    self.process_lap_data(packet, player_car_index)
                 
         except KeyboardInterrupt:
             logger.info("Telemetry listener stopped by user.")
         except Exception as e:
             logger.error(f"Error in telemetry listener: {e}")
+        finally:
+            self.running = False
         
         return True
 
 def main():
     """Main entry point."""
+    # Flush console output once per line instead of per write
+    sys.stdout.reconfigure(line_buffering=True)
+    
     try:
         # Create and run the telemetry listener
         listener = TelemetryListener()
@@ -22,12 +22,18 @@ import os
 import sys
 import time
 import logging
+import logging.handlers
 import argparse
+import functools
 import requests
-import random
+from urllib3.util.retry import Retry
 import socket
-from datetime import datetime
-from urllib.parse import urljoin
+import select
+import struct
+import ctypes
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 # Add the project root to the Python path
 script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -42,39 +48,276 @@ try:
         F1_2024_TRACKS,
         API_HOST,
         API_PORT,
-        DEFAULT_UDP_PORT
+        DEFAULT_UDP_PORT,
+        FAST_PACKET_PARSING
     )
+    from config.utils import format_lap_time, json_dumps
 except ImportError as e:
     print(f"Error importing app configuration: {e}")
     print("Make sure you're running this script from the project root directory.")
     sys.exit(1)
 
-# Add the telemetry repository to the Python path
-sys.path.append(TELEMETRY_REPO_PATH)
+# Add the telemetry repository to the Python path (once)
+if TELEMETRY_REPO_PATH not in sys.path:
+    sys.path.append(TELEMETRY_REPO_PATH)
 
 # Set up logging
+LOG_FILE_MAX_BYTES = 10_000_000
+LOG_FILE_BACKUP_COUNT = 5
+LOG_BUFFER_CAPACITY = 256  # Records buffered before writing to the log file
+
+# One rotating log file instead of a new file per launch; records are written in
+# batches, and immediately on WARNING or above
+_log_file_handler = logging.handlers.RotatingFileHandler(
+    os.path.join(project_root, "rig_listener.log"),
+    maxBytes=LOG_FILE_MAX_BYTES,
+    backupCount=LOG_FILE_BACKUP_COUNT
+)
+_log_file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
     handlers=[
         logging.StreamHandler(sys.stdout),
-        logging.FileHandler(os.path.join(project_root, f"rig_listener_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"))
+        logging.handlers.MemoryHandler(
+            capacity=LOG_BUFFER_CAPACITY,
+            flushLevel=logging.WARNING,
+            target=_log_file_handler
+        )
     ]
 )
 logger = logging.getLogger(__name__)
 
-# Define max retry attempts and backoff settings
-MAX_RETRIES = 3
-RETRY_BACKOFF_BASE = 2  # seconds
-RETRY_JITTER = 0.5  # seconds
+# Define max attempts and backoff settings for API requests
+MAX_RETRIES = 3  # Total attempts per request
+RETRY_BACKOFF_BASE = 2  # seconds, urllib3 backoff factor
+RETRY_STATUS_CODES = (500, 502, 503, 504)
+
+# Lap submission batching
+SUBMIT_BATCH_SIZE = 8  # Max lap times per request
+SUBMIT_DRAIN_TIMEOUT = 15  # seconds to wait on shutdown for queued lap times to be posted
+SUBMIT_CONCURRENCY = 4  # Parallel requests when lap times are posted individually (matches pool size)
+
+# UDP socket tuning
+UDP_RECV_BUFFER_BYTES = 4 << 20  # Kernel receive buffer, absorbs bursts while we're busy
+UDP_POLL_TIMEOUT = 0.1  # seconds to wait for a datagram before checking idle state
+UDP_MAX_PACKETS_PER_POLL = 64  # Upper bound on datagrams drained per wakeup
+SCHED_FIFO_PRIORITY = 10  # Real-time priority used with --cpu-pin (Linux only)
+
+# Minimum interval between personal-best log messages for the same car
+PB_LOG_INTERVAL_NS = 50_000_000  # 50 ms
+
+# Kernel-side packet filter (Linux only): let through Session (1) and Lap Data (2) packets.
+# Socket filters on UDP sockets see the 8-byte UDP header, and m_packetId is
+# byte 6 of the F1 2024 packet header, so the packet ID sits at offset 14.
+SO_ATTACH_FILTER = getattr(socket, "SO_ATTACH_FILTER", 26)
+BPF_PACKET_ID_OFFSET = 8 + 6
+BPF_ACCEPT_BYTES = 0x40000
+BPF_PROGRAM = (
+    # (code, jt, jf, k)
+    (0x30, 0, 0, BPF_PACKET_ID_OFFSET),  # ldb [14]
+    (0x15, 1, 0, 1),                     # jeq #1 -> accept
+    (0x15, 0, 1, 2),                     # jeq #2 -> accept, else drop
+    (0x06, 0, 0, BPF_ACCEPT_BYTES),      # accept: ret #0x40000
+    (0x06, 0, 0, 0),                     # drop: ret #0
+)
+
+# F1 2024 packet layouts (little-endian, packed) for the fast parsing path.
+# Field names follow the telemetry repository's packet classes, so these
+# structures can be passed to the same processing methods.
+NUM_CARS = 22
+
+class _PacketHeader(ctypes.LittleEndianStructure):
+    _pack_ = 1
+    _fields_ = [
+        ("m_packet_format", ctypes.c_uint16),
+        ("m_game_year", ctypes.c_uint8),
+        ("m_game_major_version", ctypes.c_uint8),
+        ("m_game_minor_version", ctypes.c_uint8),
+        ("m_packet_version", ctypes.c_uint8),
+        ("m_packet_id", ctypes.c_uint8),
+        ("m_session_uid", ctypes.c_uint64),
+        ("m_session_time", ctypes.c_float),
+        ("m_frame_identifier", ctypes.c_uint32),
+        ("m_overall_frame_identifier", ctypes.c_uint32),
+        ("m_player_car_index", ctypes.c_uint8),
+        ("m_secondary_player_car_index", ctypes.c_uint8),
+    ]
+
+class _LapData(ctypes.LittleEndianStructure):
+    _pack_ = 1
+    _fields_ = [
+        ("m_last_lap_time_in_ms", ctypes.c_uint32),
+        ("m_current_lap_time_in_ms", ctypes.c_uint32),
+        ("m_sector1_time_ms_part", ctypes.c_uint16),
+        ("m_sector1_time_minutes_part", ctypes.c_uint8),
+        ("m_sector2_time_ms_part", ctypes.c_uint16),
+        ("m_sector2_time_minutes_part", ctypes.c_uint8),
+        ("m_delta_to_car_in_front_ms_part", ctypes.c_uint16),
+        ("m_delta_to_car_in_front_minutes_part", ctypes.c_uint8),
+        ("m_delta_to_race_leader_ms_part", ctypes.c_uint16),
+        ("m_delta_to_race_leader_minutes_part", ctypes.c_uint8),
+        ("m_lap_distance", ctypes.c_float),
+        ("m_total_distance", ctypes.c_float),
+        ("m_safety_car_delta", ctypes.c_float),
+        ("m_car_position", ctypes.c_uint8),
+        ("m_current_lap_num", ctypes.c_uint8),
+        ("m_pit_status", ctypes.c_uint8),
+        ("m_num_pit_stops", ctypes.c_uint8),
+        ("m_sector", ctypes.c_uint8),
+        ("m_current_lap_invalid", ctypes.c_uint8),
+        ("m_penalties", ctypes.c_uint8),
+        ("m_total_warnings", ctypes.c_uint8),
+        ("m_corner_cutting_warnings", ctypes.c_uint8),
+        ("m_num_unserved_drive_through_pens", ctypes.c_uint8),
+        ("m_num_unserved_stop_go_pens", ctypes.c_uint8),
+        ("m_grid_position", ctypes.c_uint8),
+        ("m_driver_status", ctypes.c_uint8),
+        ("m_result_status", ctypes.c_uint8),
+        ("m_pit_lane_timer_active", ctypes.c_uint8),
+        ("m_pit_lane_time_in_lane_in_ms", ctypes.c_uint16),
+        ("m_pit_stop_timer_in_ms", ctypes.c_uint16),
+        ("m_pit_stop_should_serve_pen", ctypes.c_uint8),
+        ("m_speed_trap_fastest_speed", ctypes.c_float),
+        ("m_speed_trap_fastest_lap", ctypes.c_uint8),
+    ]
+
+class _PacketLapData(ctypes.LittleEndianStructure):
+    _pack_ = 1
+    _fields_ = [
+        ("m_header", _PacketHeader),
+        ("m_lap_data", _LapData * NUM_CARS),
+        ("m_time_trial_pb_car_idx", ctypes.c_uint8),
+        ("m_time_trial_rival_car_idx", ctypes.c_uint8),
+    ]
+
+class _PacketSessionData(ctypes.LittleEndianStructure):
+    """Leading fields of the session packet, up to and including the track ID."""
+    _pack_ = 1
+    _fields_ = [
+        ("m_header", _PacketHeader),
+        ("m_weather", ctypes.c_uint8),
+        ("m_track_temperature", ctypes.c_int8),
+        ("m_air_temperature", ctypes.c_int8),
+        ("m_total_laps", ctypes.c_uint8),
+        ("m_track_length", ctypes.c_uint16),
+        ("m_session_type", ctypes.c_uint8),
+        ("m_track_id", ctypes.c_int8),
+    ]
+
+PACKET_FORMAT_2024 = 2024
+PACKET_ID_OFFSET = 6
+_PACKET_HEADER_SIZE = ctypes.sizeof(_PacketHeader)
+# Packet ID -> (structure, minimum datagram size) for the packets the listener uses
+_RAW_PACKET_TYPES = {
+    1: (_PacketSessionData, ctypes.sizeof(_PacketSessionData)),  # Session data
+    2: (_PacketLapData, ctypes.sizeof(_PacketLapData)),          # Lap data
+}
+
+def _parse_raw_packet(data):
+    """Parse a raw F1 2024 datagram into (header, packet) structures.
+    
+    Args:
+        data (bytes): The full UDP datagram, header included
+        
+    Returns:
+        tuple: (header, packet), or None for packets the listener doesn't use
+    """
+    if len(data) < _PACKET_HEADER_SIZE:
+        return None
+    
+    packet_type = _RAW_PACKET_TYPES.get(data[PACKET_ID_OFFSET])
+    if packet_type is None:
+        return None
+    
+    structure, min_size = packet_type
+    if len(data) < min_size:
+        return None
+    
+    packet = structure.from_buffer_copy(data)
+    if packet.m_header.m_packet_format != PACKET_FORMAT_2024:
+        return None
+    return packet.m_header, packet
 
 # Reverse track dictionary mapping (ID to name)
 TRACK_ID_TO_NAME = {v: k for k, v in TRACK_ID_MAPPING.items()}
 
+# Internal track names (from track_dictionary) that don't fuzzy-match an official name
+SPECIAL_CASE_TRACK_NAMES = {
+    "sakhir": "Bahrain International Circuit",
+    "melbourne": "Albert Park Circuit",
+    "shanghai": "Shanghai International Circuit",
+    "monaco": "Circuit de Monaco",
+    "catalunya": "Circuit de Barcelona-Catalunya",
+    "spa": "Circuit de Spa-Francorchamps",
+    "interlagos": "Autódromo José Carlos Pace",
+}
+
+# Lowercased official track names for fuzzy matching, computed once at import
+_F1_2024_TRACKS_LOWER = tuple((track.lower(), track) for track in F1_2024_TRACKS)
+
+@functools.lru_cache(maxsize=64)
+def _resolve_track_name_cached(track_id):
+    """Resolve a track ID to an official track name, cached per track ID.
+    
+    Resolution never changes at runtime, so warnings are only logged the
+    first time an unmapped ID is seen.
+    
+    Args:
+        track_id (int): Track ID from telemetry
+        
+    Returns:
+        tuple: (track_name, successful)
+    """
+    # Try direct mapping from TRACK_ID_MAPPING
+    official_name = TRACK_ID_TO_NAME.get(track_id)
+    if official_name:
+        return official_name, True
+    
+    # Try to get internal name from track_dictionary
+    try:
+        from dictionnaries import track_dictionary
+        
+        if track_id in track_dictionary:
+            internal_name = track_dictionary[track_id][0]
+            
+            # Try a fuzzy (case-insensitive) match with F1_2024_TRACKS
+            internal_name_lower = internal_name.lower()
+            for official_name_lower, official_name in _F1_2024_TRACKS_LOWER:
+                if internal_name_lower in official_name_lower:
+                    return official_name, True
+            
+            # No match found, return best guess with warning
+            best_guess = SPECIAL_CASE_TRACK_NAMES.get(internal_name)
+            
+            if best_guess:
+                logger.warning(f"Track '{internal_name}' not directly mapped, using best guess: {best_guess}")
+                return best_guess, True
+            
+            # Return internal name with warning
+            logger.warning(f"Track '{internal_name}' (ID: {track_id}) not found in F1_2024_TRACKS, using internal name")
+            return f"Track: {internal_name}", False
+    except ImportError:
+        logger.error("Could not import track_dictionary from the telemetry repository")
+    
+    # Unknown track
+    logger.warning(f"Unknown track ID: {track_id}, cannot submit lap time")
+    return f"Unknown Track (ID: {track_id})", False
+
 class RigTelemetryListener:
     """Telemetry listener for F1 2024 game data from a specific rig."""
     
-    def __init__(self, rig_id, api_host, api_port, udp_port=DEFAULT_UDP_PORT):
+    # Lap report, formatted lazily by the logging module only if INFO is enabled
+    LAP_COMPLETED_MESSAGE = "\n".join([
+        "New Lap Completed - %s (Index: %d)",
+        "  Track: %s",
+        "  Lap Time: %s",
+        "  Position: %d",
+        "  Current Lap: %d",
+        "",
+    ])
+    
+    def __init__(self, rig_id, api_host, api_port, udp_port=DEFAULT_UDP_PORT, cpu_pin=None):
         """Initialize the telemetry listener.
         
         Args:
@@ -82,23 +325,61 @@ class RigTelemetryListener:
             api_host (str): Host address for the backend API
             api_port (int): Port for the backend API
             udp_port (int): UDP port to listen on (default: 20777)
+            cpu_pin (int): CPU to pin the listener to, or None to leave scheduling alone
         """
         self.rig_id = rig_id
         self.udp_port = udp_port
+        self.cpu_pin = cpu_pin
         self.api_base_url = f"http://{api_host}:{api_port}"
-        self.lap_submission_url = urljoin(self.api_base_url, "/api/laptime")
+        self.lap_submission_url = f"{self.api_base_url}/api/laptime"
+        self.lap_batch_submission_url = f"{self.api_base_url}/api/laptime/batch"
+        self._batch_supported = True  # Cleared if the backend has no batch endpoint
+        # Pre-serialized single-lap JSON body; only the track name and lap time vary per submission
+        self._lap_payload_template = (
+            b'{"rig_identifier": ' + json_dumps(self.rig_id).replace(b"%", b"%%")
+            + b', "track_name": %s, "lap_time_ms": %d}'
+        )
         
         self.listener = None
-        self.players = None
+        self._socket = None  # Underlying UDP socket of the listener, if exposed
+        self._fast_parsing = False  # Parse raw datagrams with the ctypes structures above
+        self.best_lap_times = None
         self.session = None
+        self._track_cache = (None, "", False)  # (track_id, track_name, resolved) of the current track
         self.last_lap_times = None
+        self._last_lap_snapshot = None  # Last lap times of all cars in the previous LapData packet
+        self._last_pb_log_ns = [0] * 22  # Monotonic time of each car's last personal-best log
         self.running = False
         self.connection_error_count = 0
         self.max_connection_errors = 10
         
+        # Persistent HTTP session so lap submissions reuse one keep-alive connection
+        self.http = requests.Session()
+        # Retries (including POSTs) are handled by urllib3; the backend skips duplicate lap times,
+        # so re-sending a submission whose response was lost is harmless
+        retry = Retry(
+            total=MAX_RETRIES - 1,
+            backoff_factor=RETRY_BACKOFF_BASE,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=frozenset({"GET", "POST"}),
+            raise_on_status=False
+        )
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=SUBMIT_CONCURRENCY, max_retries=retry)
+        self.http.mount("http://", adapter)
+        self.http.headers.update({"Content-Type": "application/json", "Connection": "keep-alive"})
+        
         # Track submitted lap times to avoid duplicates
         # Format: {(track_name, lap_time_ms): timestamp}
         self.submitted_lap_times = {}
+        # Guards submitted_lap_times and connection_error_count, which the post pool
+        # threads update while the main thread may reset them
+        self._submit_lock = threading.Lock()
+        
+        # Lap submissions are posted by a worker thread so HTTP never blocks UDP reception
+        self._submit_q = queue.Queue(maxsize=256)
+        # Overlaps individual posts so several lap times cost about one round-trip
+        self._post_pool = ThreadPoolExecutor(max_workers=SUBMIT_CONCURRENCY, thread_name_prefix="lap-post")
+        threading.Thread(target=self._submit_worker, daemon=True).start()
         
         logger.info(f"Rig ID: {self.rig_id}")
         logger.info(f"API endpoint: {self.lap_submission_url}")
@@ -110,13 +391,14 @@ class RigTelemetryListener:
             # Import telemetry components
             from parser2024 import Listener, HEADER_FIELD_TO_PACKET_TYPE
             from dictionnaries import track_dictionary, conversion
-            from Player import Player
             from Session import Session
 
-            self.players = [Player() for _ in range(22)]  # F1 has a maximum of 22 cars
+            self.best_lap_times = [0] * 22  # Best lap time per car, F1 has a maximum of 22 cars
             self.session = Session()
             self.last_lap_times = [0] * 22  # Store previous lap times to detect changes
-            self.connection_error_count = 0
+            self._last_lap_snapshot = None
+            with self._submit_lock:
+                self.connection_error_count = 0
             
             # Note: We don't reset submitted_lap_times here to prevent duplicates after reconnect
             
@@ -170,9 +452,13 @@ class RigTelemetryListener:
                 else:
                     return False
             
+            self._configure_socket()
+            
             # Test API connection
             try:
                 logger.info(f"Testing API connection to {self.api_base_url}")
+                # Plain request, not the retrying session: this is only a probe and
+                # shouldn't hold up (re)initialization for the full retry schedule
                 response = requests.get(self.api_base_url, timeout=5)
                 logger.info(f"API connection test: {response.status_code}")
             except requests.RequestException as e:
@@ -184,6 +470,91 @@ class RigTelemetryListener:
             logger.error(f"Failed to initialize listener: {e}")
             return False
     
+    def _configure_socket(self):
+        """Tune the listener's UDP socket, if accessible.
+        
+        Enlarges the receive buffer and switches the socket to non-blocking mode,
+        so a burst can be drained with one recv per datagram after a single select().
+        """
+        self._socket = getattr(self.listener, "socket", None)
+        if self._socket is None:
+            logger.warning("Listener socket not accessible, falling back to polling the listener")
+            return
+        
+        try:
+            self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, UDP_RECV_BUFFER_BYTES)
+            # The kernel may silently cap the request (net.core.rmem_max on Linux)
+            granted = self._socket.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)
+            if granted < UDP_RECV_BUFFER_BYTES:
+                logger.warning(f"UDP receive buffer is {granted} bytes, requested {UDP_RECV_BUFFER_BYTES}; "
+                               f"raise net.core.rmem_max to avoid drops during bursts")
+        except OSError as e:
+            logger.warning(f"Could not set UDP receive buffer size: {e}")
+        
+        self._attach_packet_filter()
+        self._socket.setblocking(False)
+        self._fast_parsing = FAST_PACKET_PARSING
+    
+    def _attach_packet_filter(self):
+        """Attach a BPF filter so only session and lap data packets reach userspace.
+        
+        Only supported on Linux; on other platforms all packets are delivered
+        and filtered by packet ID in the run loop as before.
+        """
+        if not sys.platform.startswith("linux"):
+            return
+        
+        filter_bytes = b"".join(struct.pack("HBBI", *insn) for insn in BPF_PROGRAM)
+        # Keep the instruction buffer referenced while the kernel copies it
+        self._bpf_program = ctypes.create_string_buffer(filter_bytes)
+        fprog = struct.pack("HP", len(BPF_PROGRAM), ctypes.addressof(self._bpf_program))
+        
+        try:
+            self._socket.setsockopt(socket.SOL_SOCKET, SO_ATTACH_FILTER, fprog)
+            logger.info("Attached kernel packet filter (session and lap data only)")
+        except OSError as e:
+            logger.warning(f"Could not attach kernel packet filter: {e}")
+    
+    def _poll_packets(self, timeout=UDP_POLL_TIMEOUT):
+        """Wait for telemetry data and return every packet that is ready.
+        
+        Blocks in select() until the socket is readable (or the timeout expires),
+        then drains up to UDP_MAX_PACKETS_PER_POLL queued datagrams without
+        further waiting.
+        
+        Args:
+            timeout (float): Maximum time to wait for data, in seconds
+            
+        Returns:
+            list: (header, packet) tuples, empty if nothing arrived
+        """
+        if self._socket is None:
+            header_and_packet = self.listener.get()
+            return [header_and_packet] if header_and_packet else []
+        
+        packets = []
+        readable, _, _ = select.select([self._socket], [], [], timeout)
+        if not readable:
+            return packets
+        
+        get = self._get_raw_packet if self._fast_parsing else self.listener.get
+        for _ in range(UDP_MAX_PACKETS_PER_POLL):
+            try:
+                header_and_packet = get()
+            except BlockingIOError:
+                break  # Socket drained
+            if header_and_packet:
+                packets.append(header_and_packet)
+        return packets
+    
+    def _get_raw_packet(self):
+        """Receive one datagram and parse it with the fast ctypes parser.
+        
+        Returns:
+            tuple: (header, packet), or None for packets the listener doesn't use
+        """
+        return _parse_raw_packet(self._socket.recv(2048))
+    
     def resolve_track_name(self, track_id):
         """Resolve the track ID to an official track name from F1_2024_TRACKS.
         
@@ -195,56 +566,7 @@ class RigTelemetryListener:
             - track_name (str): Official track name or best guess
             - successful (bool): Whether the resolution was successful
         """
-        # Try direct mapping from TRACK_ID_MAPPING
-        for official_name, tid in TRACK_ID_MAPPING.items():
-            if tid == track_id:
-                return official_name, True
-        
-        # Try to get internal name from track_dictionary
-        try:
-            from dictionnaries import track_dictionary
-            
-            if track_id in track_dictionary:
-                internal_name = track_dictionary[track_id][0]
-                
-                # Try a fuzzy match with F1_2024_TRACKS
-                for official_name in F1_2024_TRACKS:
-                    # Convert to lowercase for matching
-                    if internal_name.lower() in official_name.lower():
-                        return official_name, True
-                
-                # No match found, return best guess with warning
-                best_guess = None
-                
-                # Special cases
-                if internal_name == "sakhir":
-                    best_guess = "Bahrain International Circuit"
-                elif internal_name == "melbourne":
-                    best_guess = "Albert Park Circuit"
-                elif internal_name == "shanghai": 
-                    best_guess = "Shanghai International Circuit"
-                elif internal_name == "monaco":
-                    best_guess = "Circuit de Monaco"
-                elif internal_name == "catalunya":
-                    best_guess = "Circuit de Barcelona-Catalunya"
-                elif internal_name == "spa":
-                    best_guess = "Circuit de Spa-Francorchamps"
-                elif internal_name == "interlagos":
-                    best_guess = "Autódromo José Carlos Pace"
-                
-                if best_guess:
-                    logger.warning(f"Track '{internal_name}' not directly mapped, using best guess: {best_guess}")
-                    return best_guess, True
-                
-                # Return internal name with warning
-                logger.warning(f"Track '{internal_name}' (ID: {track_id}) not found in F1_2024_TRACKS, using internal name")
-                return f"Track: {internal_name}", False
-        except ImportError:
-            logger.error("Could not import track_dictionary from the telemetry repository")
-        
-        # Unknown track
-        logger.warning(f"Unknown track ID: {track_id}, cannot submit lap time")
-        return f"Unknown Track (ID: {track_id})", False
+        return _resolve_track_name_cached(track_id)
     
     def format_lap_time(self, milliseconds):
         """Format lap time from milliseconds to MM:SS.mmm.
@@ -255,18 +577,110 @@ class RigTelemetryListener:
         Returns:
             str: Formatted lap time as MM:SS.mmm
         """
-        if milliseconds == 0:
-            return "00:00.000"
+        return format_lap_time(milliseconds)
+    
+    def submit_lap_time(self, track_name, lap_time_ms):
+        """Queue a lap time for submission to the backend API.
         
-        total_seconds = milliseconds / 1000
-        minutes = int(total_seconds // 60)
-        seconds = int(total_seconds % 60)
-        milliseconds = int((total_seconds - int(total_seconds)) * 1000)
+        Lap times that queue up while an earlier submission is in flight are posted together.
         
-        return f"{minutes:02d}:{seconds:02d}.{milliseconds:03d}"
+        Args:
+            track_name (str): Name of the track
+            lap_time_ms (int): Lap time in milliseconds
+            
+        Returns:
+            bool: True if queued, False if the submission queue is full
+        """
+        try:
+            self._submit_q.put_nowait((track_name, lap_time_ms))
+            return True
+        except queue.Full:
+            logger.warning(f"Submission queue full, dropping lap time for {track_name} ({self.format_lap_time(lap_time_ms)})")
+            return False
     
-    def submit_lap_time(self, track_name, lap_time_ms):
-        """Submit lap time to the backend API with retries.
+    def _submit_worker(self):
+        """Post queued lap times to the backend API, batching laps that are already waiting."""
+        while True:
+            batch = [self._submit_q.get()]
+            # Don't wait for more laps (a lone lap is posted immediately), but pick up
+            # any that queued while the previous submission was in flight
+            while len(batch) < SUBMIT_BATCH_SIZE:
+                try:
+                    batch.append(self._submit_q.get_nowait())
+                except queue.Empty:
+                    break
+            
+            try:
+                self._submit_batch(batch)
+            except Exception as e:
+                logger.error(f"Unexpected error submitting lap times: {e}")
+            finally:
+                for _ in batch:
+                    self._submit_q.task_done()
+    
+    def _drain_submissions(self, timeout=SUBMIT_DRAIN_TIMEOUT):
+        """Wait for queued lap times to be posted, like Queue.join() but bounded.
+        
+        Args:
+            timeout (float): Maximum seconds to wait
+            
+        Returns:
+            bool: True if every queued lap time was processed
+        """
+        with self._submit_q.all_tasks_done:
+            return self._submit_q.all_tasks_done.wait_for(
+                lambda: not self._submit_q.unfinished_tasks, timeout=timeout)
+    
+    def _submit_batch(self, batch):
+        """Submit a batch of queued lap times, skipping ones already submitted.
+        
+        Args:
+            batch (list): (track_name, lap_time_ms) tuples
+        """
+        laps = [lap for lap in dict.fromkeys(batch) if not self._already_submitted(*lap)]
+        
+        if len(laps) > 1 and self._batch_supported:
+            self._do_batch_post(laps)
+        elif laps:
+            self._post_individually(laps)
+    
+    def _post_individually(self, laps):
+        """Submit lap times with one request each, running the requests concurrently.
+        
+        Args:
+            laps (list): (track_name, lap_time_ms) tuples
+            
+        Returns:
+            bool: True if every lap time was submitted, False otherwise
+        """
+        if len(laps) == 1:
+            return self._do_post(*laps[0])
+        
+        results = self._post_pool.map(lambda lap: self._do_post(*lap), laps)
+        return all(list(results))
+    
+    def _already_submitted(self, track_name, lap_time_ms):
+        """Check if this exact lap time was already submitted for this track.
+        
+        Args:
+            track_name (str): Name of the track
+            lap_time_ms (int): Lap time in milliseconds
+            
+        Returns:
+            bool: True if the lap time was already submitted
+        """
+        with self._submit_lock:
+            submitted_at = self.submitted_lap_times.get((track_name, lap_time_ms))
+        if submitted_at is None:
+            return False
+        
+        time_ago = time.time() - submitted_at
+        logger.info(f"Ignoring duplicate lap time for {track_name} ({self.format_lap_time(lap_time_ms)}), " 
+                    f"already submitted {time_ago:.1f} seconds ago")
+        return True
+    
+    def _do_post(self, track_name, lap_time_ms):
+        """Submit a single lap time to the backend API with retries.
         
         Args:
             track_name (str): Name of the track
@@ -275,62 +689,111 @@ class RigTelemetryListener:
         Returns:
             bool: True if successful, False otherwise
         """
-        # Check if this exact lap time was already submitted for this track
-        lap_key = (track_name, lap_time_ms)
-        if lap_key in self.submitted_lap_times:
-            time_ago = time.time() - self.submitted_lap_times[lap_key]
-            logger.info(f"Ignoring duplicate lap time for {track_name} ({self.format_lap_time(lap_time_ms)}), " 
-                        f"already submitted {time_ago:.1f} seconds ago")
-            return True
+        body = self._lap_payload_template % (json_dumps(track_name), lap_time_ms)
+        
+        response = self._post_with_retries(self.lap_submission_url, body)
+        if response is None:
+            return False
+        
+        if response.status_code != 200:
+            # Client error, likely won't succeed with retry
+            logger.error(f"Failed to submit lap time: HTTP {response.status_code}")
+            logger.error(f"Response: {response.text}")
+            return False
+        
+        result = response.json()
+        logger.info(f"Lap time submitted successfully: {result.get('message')}")
+        
+        # Record this lap time as submitted with current timestamp
+        with self._submit_lock:
+            self.submitted_lap_times[(track_name, lap_time_ms)] = time.time()
+        return True
+    
+    def _do_batch_post(self, laps):
+        """Submit several lap times to the backend API in one request.
+        
+        Falls back to individual submissions if the backend rejects the batch, and
+        stops batching altogether if it has no batch endpoint.
+        
+        Args:
+            laps (list): (track_name, lap_time_ms) tuples
             
+        Returns:
+            bool: True if every lap time was submitted, False otherwise
+        """
         payload = {
-            "rig_identifier": self.rig_id,
-            "track_name": track_name,
-            "lap_time_ms": lap_time_ms
+            "submissions": [
+                {"rig_identifier": self.rig_id, "track_name": track_name, "lap_time_ms": lap_time_ms}
+                for track_name, lap_time_ms in laps
+            ]
         }
         
-        for attempt in range(MAX_RETRIES):
-            try:
-                response = requests.post(
-                    self.lap_submission_url,
-                    json=payload,
-                    timeout=5  # 5 second timeout
-                )
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    logger.info(f"Lap time submitted successfully: {result.get('message')}")
-                    self.connection_error_count = 0  # Reset error counter on success
-                    
-                    # Record this lap time as submitted with current timestamp
-                    self.submitted_lap_times[lap_key] = time.time()
-                    
-                    return True
-                elif response.status_code >= 500:
-                    # Server error, might be temporary
-                    logger.warning(f"Server error when submitting lap time: HTTP {response.status_code}, attempt {attempt+1}/{MAX_RETRIES}")
-                else:
-                    # Client error, likely won't succeed with retry
-                    logger.error(f"Failed to submit lap time: HTTP {response.status_code}")
-                    logger.error(f"Response: {response.text}")
-                    return False
-                    
-            except requests.RequestException as e:
-                logger.error(f"Error submitting lap time to API (attempt {attempt+1}/{MAX_RETRIES}): {e}")
+        response = self._post_with_retries(self.lap_batch_submission_url, json_dumps(payload))
+        if response is None:
+            return False
+        
+        if response.status_code in (404, 405):
+            logger.warning("Backend does not support batch submissions, submitting lap times individually")
+            self._batch_supported = False
+            return self._post_individually(laps)
+        
+        if response.status_code != 200:
+            # Batch rejected as a whole (e.g. validation error), retry the laps one by one
+            # so a single bad entry doesn't lose the others
+            logger.warning(f"Batch submission rejected: HTTP {response.status_code}, submitting lap times individually")
+            logger.warning(f"Response: {response.text}")
+            return self._post_individually(laps)
+        
+        result = response.json()
+        logger.info(f"Lap times submitted successfully: {result.get('message')}")
+        
+        # Record the accepted lap times as submitted with current timestamp
+        now = time.time()
+        with self._submit_lock:
+            for lap, lap_result in zip(laps, result.get("results", [])):
+                if lap_result.get("success"):
+                    self.submitted_lap_times[lap] = now
+        return bool(result.get("success"))
+    
+    def _post_with_retries(self, url, body):
+        """POST a serialized JSON body to the backend API.
+        
+        Server and connection errors are retried with exponential backoff by the
+        session's urllib3 Retry policy before this returns.
+        
+        Args:
+            url (str): Endpoint URL
+            body (bytes): JSON-encoded request body
+            
+        Returns:
+            requests.Response: The final response, or None if every attempt failed
+        """
+        try:
+            response = self.http.post(
+                url,
+                data=body,  # Content-Type is set on the session
+                timeout=5  # 5 second timeout
+            )
+        except requests.RequestException as e:
+            logger.error(f"Error submitting lap time to API after {MAX_RETRIES} attempts: {e}")
+            with self._submit_lock:
                 self.connection_error_count += 1
+                error_count = self.connection_error_count
             
-            # Exponential backoff with jitter before retry
-            if attempt < MAX_RETRIES - 1:  # Don't sleep after the last attempt
-                backoff = RETRY_BACKOFF_BASE * (2 ** attempt) + random.uniform(0, RETRY_JITTER)
-                logger.info(f"Retrying in {backoff:.2f} seconds...")
-                time.sleep(backoff)
-                
-        # Check if we're having persistent connection issues
-        if self.connection_error_count >= self.max_connection_errors:
-            logger.warning(f"Persistent connection errors detected ({self.connection_error_count}). "
-                         f"Will continue capturing telemetry but API submissions may fail.")
+            # Check if we're having persistent connection issues
+            if error_count >= self.max_connection_errors:
+                logger.warning(f"Persistent connection errors detected ({error_count}). "
+                             f"Will continue capturing telemetry but API submissions may fail.")
+            return None
+        
+        if response.status_code >= 500:
+            logger.warning(f"Server error when submitting lap time: HTTP {response.status_code} after {MAX_RETRIES} attempts")
+            return None
         
-        return False
+        if response.status_code == 200:
+            with self._submit_lock:
+                self.connection_error_count = 0  # Reset error counter on success
+        return response
     
     def process_lap_data(self, packet, player_car_index):
         """Process lap data packet, print and submit new lap times.
@@ -339,53 +802,86 @@ class RigTelemetryListener:
             packet: The LapData packet
             player_car_index (int): Index of the player's car
         """
-        for i in range(len(packet.m_lap_data)):
-            lap_data = packet.m_lap_data[i]
-            player = self.players[i]
+        # No session packet seen yet: the track is unknown, so nothing can be reported or
+        # submitted (lap state is reset anyway once the track is set)
+        if self.session.track == -1:
+            return
+        
+        lap_data_entries = packet.m_lap_data
+        snapshot = tuple(lap_data.m_last_lap_time_in_ms for lap_data in lap_data_entries)
+        
+        # Nothing to do unless some car's last lap time changed since the previous packet
+        if snapshot == self._last_lap_snapshot:
+            return
+        self._last_lap_snapshot = snapshot
+        
+        # Cars that completed a new lap since the last packet
+        last_lap_times = self.last_lap_times
+        completed = [
+            i for i, last_lap_time in enumerate(snapshot)
+            if last_lap_time != 0 and last_lap_time != last_lap_times[i]
+        ]
+        
+        # Record every new lap time, then keep only valid laps for reporting and submission
+        for i in completed:
+            last_lap_times[i] = snapshot[i]
+        valid = [i for i in completed if not lap_data_entries[i].m_current_lap_invalid]
+        
+        if not valid:
+            return
+        
+        # Resolved track name for API submission
+        track_id, track_name, track_resolved = self._track_cache
+        if track_id != self.session.track:
+            self._track_cache = (self.session.track, *self.resolve_track_name(self.session.track))
+            track_id, track_name, track_resolved = self._track_cache
+        
+        # Bind loop-invariant lookups to locals
+        best_lap_times = self.best_lap_times
+        last_pb_log_ns = self._last_pb_log_ns
+        submit = self.submit_lap_time
+        fmt = format_lap_time
+        log_info = logger.info
+        report = logger.isEnabledFor(logging.INFO)
+        
+        for i in valid:
+            last_lap_time = snapshot[i]
+            lap_data = lap_data_entries[i]
             
-            # Update player lap times
-            current_lap_time = lap_data.m_current_lap_time_in_ms
-            last_lap_time = lap_data.m_last_lap_time_in_ms
+            # Print lap information for all cars (for debugging), skipped entirely below INFO
+            if report:
+                car_type = "Player Car" if i == player_car_index else "AI Car"
+                log_info(
+                    self.LAP_COMPLETED_MESSAGE,
+                    car_type, i, track_name, fmt(last_lap_time),
+                    lap_data.m_car_position, lap_data.m_current_lap_num
+                )
             
-            # Store the last lap time
-            player.lastLapTime = last_lap_time
-            player.currentLapTime = current_lap_time
+            # Update best lap time if applicable
+            if best_lap_times[i] > last_lap_time or best_lap_times[i] == 0:
+                best_lap_times[i] = last_lap_time
+                if report:
+                    # Rate-limit per car, near-identical consecutive packets would repeat it
+                    now = time.monotonic_ns()
+                    if now - last_pb_log_ns[i] > PB_LOG_INTERVAL_NS:
+                        last_pb_log_ns[i] = now
+                        log_info("  New Personal Best: %s", fmt(last_lap_time))
             
-            # Check if this is a new completed lap
-            if last_lap_time != 0 and last_lap_time != self.last_lap_times[i]:
-                self.last_lap_times[i] = last_lap_time
-                
-                # Only process valid laps
-                if not lap_data.m_current_lap_invalid:
-                    formatted_time = self.format_lap_time(last_lap_time)
-                    
-                    # Check if this is the player's car
-                    car_type = "Player Car" if i == player_car_index else "AI Car"
-                    
-                    # Resolve track name for API submission
-                    track_name, track_resolved = self.resolve_track_name(self.session.track)
-                    
-                    # Print lap information for all cars (for debugging)
-                    logger.info(
-                        f"New Lap Completed - {car_type} (Index: {i})\n"
-                        f"  Track: {track_name}\n"
-                        f"  Lap Time: {formatted_time}\n"
-                        f"  Position: {lap_data.m_car_position}\n"
-                        f"  Current Lap: {lap_data.m_current_lap_num}\n"
-                    )
-                    
-                    # Update best lap time if applicable
-                    if player.bestLapTime > last_lap_time or player.bestLapTime == 0:
-                        player.bestLapTime = last_lap_time
-                        formatted_best = self.format_lap_time(player.bestLapTime)
-                        logger.info(f"  New Personal Best: {formatted_best}")
-                    
-                    # Only submit lap times for the player's car (index 0), ignoring AI cars
-                    if track_resolved and i == player_car_index:
-                        logger.info(f"Submitting lap time to API: {track_name} - {formatted_time}")
-                        self.submit_lap_time(track_name, last_lap_time)
-                    elif i != player_car_index:
-                        logger.debug(f"Ignoring AI car lap time (Index: {i})")
+            # Only submit lap times for the player's car (index 0), ignoring AI cars
+            if track_resolved and i == player_car_index:
+                if report:
+                    log_info("Submitting lap time to API: %s - %s", track_name, fmt(last_lap_time))
+                submit(track_name, last_lap_time)
+            elif i != player_car_index:
+                logger.debug("Ignoring AI car lap time (Index: %d)", i)
+    
+    def _handle_session_packet(self, header, packet):
+        """Dispatch target for session packets."""
+        self.process_session_data(packet)
+    
+    def _handle_lap_packet(self, header, packet):
+        """Dispatch target for lap data packets."""
+        self.process_lap_data(packet, header.m_player_car_index)
     
     def process_session_data(self, packet):
         """Process session data packet to update track information.
@@ -395,73 +891,112 @@ class RigTelemetryListener:
         """
         # Update track ID if changed
         if self.session.track != packet.m_track_id:
-            track_name, _ = self.resolve_track_name(self.session.track if self.session.track != -1 else 0)
-            old_track = track_name if self.session.track != -1 else "None"
+            # The old track name is only needed for the log message
+            old_track = None
+            if logger.isEnabledFor(logging.INFO):
+                old_track_id, cached_name, _ = self._track_cache
+                if self.session.track == -1:
+                    old_track = "None"
+                elif old_track_id == self.session.track:
+                    old_track = cached_name
+                else:
+                    old_track, _ = self.resolve_track_name(self.session.track)
             
             self.session.track = packet.m_track_id
-            new_track, _ = self.resolve_track_name(self.session.track)
+            new_track, resolved = self.resolve_track_name(self.session.track)
+            self._track_cache = (self.session.track, new_track, resolved)
             
-            logger.info(f"Track changed: {old_track} -> {new_track}")
+            if old_track is not None:
+                logger.info(f"Track changed: {old_track} -> {new_track}")
             
-            # Reset lap times when track changes
-            self.last_lap_times = [0] * 22
-            for player in self.players:
-                player.bestLapTime = 0
-                player.lastLapTime = 0
+            # Reset lap times in place when track changes
+            self.last_lap_times[:] = (0,) * len(self.last_lap_times)
+            self.best_lap_times[:] = (0,) * len(self.best_lap_times)
+            self._last_lap_snapshot = None
                 
             # Clear submitted lap times for the new track to prevent issues with the 
             # same lap time being considered a duplicate after track change
-            new_submitted_lap_times = {}
-            for (track, lap_time), timestamp in self.submitted_lap_times.items():
-                if track != new_track:
-                    new_submitted_lap_times[(track, lap_time)] = timestamp
-            self.submitted_lap_times = new_submitted_lap_times
+            # (under the lock, so entries the post pool adds meanwhile aren't lost)
+            with self._submit_lock:
+                self.submitted_lap_times = {
+                    (track, lap_time): timestamp
+                    for (track, lap_time), timestamp in self.submitted_lap_times.items()
+                    if track != new_track
+                }
             
             logger.info(f"Reset lap times and lap submission history for track: {new_track}")
     
+    def _apply_cpu_pinning(self):
+        """Pin the listener to a single CPU and request real-time scheduling.
+        
+        Both calls are Linux-only; SCHED_FIFO additionally needs CAP_SYS_NICE.
+        Failures are logged and the listener keeps running with default scheduling.
+        """
+        if not hasattr(os, "sched_setaffinity"):
+            logger.warning("CPU pinning is not supported on this platform, ignoring --cpu-pin")
+            return
+        
+        try:
+            os.sched_setaffinity(0, {self.cpu_pin})
+            logger.info(f"Pinned listener to CPU {self.cpu_pin}")
+        except OSError as e:
+            logger.warning(f"Could not pin listener to CPU {self.cpu_pin}: {e}")
+            return
+        
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(SCHED_FIFO_PRIORITY))
+            logger.info(f"Using SCHED_FIFO scheduling (priority {SCHED_FIFO_PRIORITY})")
+        except OSError as e:
+            logger.warning(f"Could not enable SCHED_FIFO scheduling (needs CAP_SYS_NICE): {e}")
+    
     def run(self):
         """Main loop to capture and process telemetry data."""
         if not self.initialize():
             logger.error("Failed to initialize telemetry listener, exiting.")
             return False
         
+        if self.cpu_pin is not None:
+            self._apply_cpu_pinning()
+        
         self.running = True
         logger.info(f"Telemetry listener for rig {self.rig_id} started. Waiting for F1 2024 telemetry data...")
         logger.info("Press Ctrl+C to stop.")
         
-        # Track errors for reconnection logic
+        # Track errors for reconnection logic (timings use the monotonic clock,
+        # so wall-clock adjustments can't trigger or suppress reconnects)
         consecutive_errors = 0
-        last_data_time = time.time()
+        last_data_time = time.monotonic()
         reconnect_wait = 5  # seconds
         max_consecutive_errors = 10
         max_idle_time = 30  # seconds without data before reconnect
-        last_reinit_attempt = 0  # timestamp of last reinitialization attempt
+        last_reinit_attempt = float("-inf")  # monotonic time of last reinitialization attempt
         min_reinit_interval = 60  # minimum seconds between reinitialization attempts
         
+        # Packet ID -> handler(header, packet)
+        packet_handlers = {
+            1: self._handle_session_packet,  # Session data (includes track info)
+            2: self._handle_lap_packet,      # Lap data
+        }
+        
         try:
             while self.running:
                 try:
-                    # Get packet from the listener
-                    header_and_packet = self.listener.get()
+                    # Wait for packets from the listener
+                    packets = self._poll_packets()
                     
-                    if header_and_packet:
-                        header, packet = header_and_packet
+                    if packets:
                         consecutive_errors = 0  # Reset error counter
-                        last_data_time = time.time()
-                        
-                        # Get player car index
-                        player_car_index = header.m_player_car_index
+                        last_data_time = time.monotonic()
                         
-                        # Process different packet types
-                        if header.m_packet_id == 1:  # Session data (includes track info)
-                            self.process_session_data(packet)
-                        
-                        elif header.m_packet_id == 2:  # Lap data
-                            self.process_lap_data(packet, player_car_index)
+                        for header, packet in packets:
+                            # Process the packet types we handle, ignore the rest
+                            handler = packet_handlers.get(header.m_packet_id)
+                            if handler is not None:
+                                handler(header, packet)
                     
                     # Check for idle time (no data received)
-                    elif time.time() - last_data_time > max_idle_time:
-                        current_time = time.time()
+                    elif time.monotonic() - last_data_time > max_idle_time:
+                        current_time = time.monotonic()
                         # Only attempt reinitialization if enough time has passed since the last attempt
                         if current_time - last_reinit_attempt >= min_reinit_interval:
                             logger.warning(f"No data received for {max_idle_time} seconds. F1 game might not be running.")
@@ -479,7 +1014,7 @@ class RigTelemetryListener:
                             
                             if self.initialize():
                                 logger.info("Listener reinitialized successfully.")
-                                last_data_time = time.time()  # Reset timer
+                                last_data_time = time.monotonic()  # Reset timer
                             else:
                                 logger.error("Failed to reinitialize listener.")
                                 time.sleep(reconnect_wait)
@@ -490,15 +1025,12 @@ class RigTelemetryListener:
                             if int(current_time) % 30 == 0:
                                 wait_time = min_reinit_interval - (current_time - last_reinit_attempt)
                                 logger.info(f"Waiting {wait_time:.1f} seconds before attempting reinitialization again.")
-                    
-                    # Small sleep to prevent high CPU usage
-                    time.sleep(0.001)
                 
                 except (socket.error, OSError) as e:
                     consecutive_errors += 1
                     logger.error(f"Network error: {e}")
                     
-                    current_time = time.time()
+                    current_time = time.monotonic()
                     if consecutive_errors >= max_consecutive_errors and current_time - last_reinit_attempt >= min_reinit_interval:
                         logger.warning(f"Too many consecutive errors ({consecutive_errors}). Reinitializing listener...")
                         
@@ -524,7 +1056,7 @@ class RigTelemetryListener:
                     consecutive_errors += 1
                     logger.error(f"Error processing telemetry data: {e}")
                     
-                    current_time = time.time()
+                    current_time = time.monotonic()
                     if consecutive_errors >= max_consecutive_errors and current_time - last_reinit_attempt >= min_reinit_interval:
                         logger.warning(f"Too many consecutive errors ({consecutive_errors}). Reinitializing listener...")
                         
@@ -550,6 +1082,12 @@ class RigTelemetryListener:
                     logger.info("UDP listener closed.")
                 except Exception as e:
                     logger.error(f"Error closing listener: {e}")
+            # Post any laps still queued before tearing down the pool and session
+            if not self._drain_submissions():
+                logger.warning(f"{self._submit_q.unfinished_tasks} lap time(s) still unsubmitted "
+                               f"after waiting {SUBMIT_DRAIN_TIMEOUT} seconds on shutdown")
+            self._post_pool.shutdown(wait=False, cancel_futures=True)
+            self.http.close()
         
         return True
 
@@ -600,6 +1138,20 @@ def parse_arguments():
         help=f"UDP port to listen on"
     )
     
+    parser.add_argument(
+        "--cpu-pin",
+        type=int,
+        default=None,
+        help="Pin the listener to this CPU and request SCHED_FIFO scheduling (Linux only)"
+    )
+    
+    parser.add_argument(
+        "--log-level",
+        default="INFO",
+        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+        help="Logging level; WARNING suppresses per-lap reports"
+    )
+    
     return parser.parse_args()
 
 def main():
@@ -607,13 +1159,15 @@ def main():
     try:
         # Parse command-line arguments
         args = parse_arguments()
+        logging.getLogger().setLevel(args.log_level)
         
         # Create and run the telemetry listener
         listener = RigTelemetryListener(
             rig_id=args.rig_id,
             api_host=args.api_host,
             api_port=args.api_port,
-            udp_port=args.udp_port
+            udp_port=args.udp_port,
+            cpu_pin=args.cpu_pin
         )
         
         listener.run()
@@ -89,8 +89,10 @@ TRACK_ID_MAPPING = {
 # Path to the telemetry repository - check multiple possible locations
 import os
 
-# Common locations where the F1 telemetry repository might be installed
-_POSSIBLE_TELEMETRY_PATHS = [
+# Common locations where the F1 telemetry repository might be installed.
+# The F1_TELEMETRY_REPO environment variable, if set, takes precedence.
+_POSSIBLE_TELEMETRY_PATHS = (
+    os.environ.get("F1_TELEMETRY_REPO"),
     "C:/f1-24-telemetry-application",         # Auto-downloaded location
     "C:/Users/landg/Desktop/f1-24-app/f1-24-telemetry-application",
     "C:/F1Telemetry/f1-24-telemetry-application", 
@@ -98,18 +100,14 @@ _POSSIBLE_TELEMETRY_PATHS = [
     os.path.join(os.path.expanduser("~"), "Desktop", "f1-24-telemetry-application"),
     os.path.join(os.path.expanduser("~"), "Documents", "f1-24-telemetry-application"),
     os.path.join(os.path.dirname(__file__), "..", "f1-24-telemetry-application"),  # Relative to installer
-]
-
-# Find the first existing telemetry repository path
-TELEMETRY_REPO_PATH = None
-for path in _POSSIBLE_TELEMETRY_PATHS:
-    if os.path.exists(path):
-        TELEMETRY_REPO_PATH = path
-        break
+)
 
+# Resolve the first existing telemetry repository path once, at import time.
 # If not found, use the default (original) path - the rig_listener will handle the error
-if TELEMETRY_REPO_PATH is None:
-    TELEMETRY_REPO_PATH = "C:/f1-24-telemetry-application"
+TELEMETRY_REPO_PATH = next(
+    (os.path.abspath(p) for p in _POSSIBLE_TELEMETRY_PATHS if p and os.path.isdir(p)),
+    "C:/f1-24-telemetry-application"
+)
 
 # Database URL
 DATABASE_URL = "backend/database/f1_leaderboard.db"
@@ -132,4 +130,8 @@ DEFAULT_RIG_NAMES = {
 }
 
 # Default UDP port for telemetry data
-DEFAULT_UDP_PORT = 20777 
\ No newline at end of file
+DEFAULT_UDP_PORT = 20777 
+
+# Read session/lap data straight from the UDP bytes instead of building the
+# telemetry repository's packet objects (set to False to use its parser)
+FAST_PACKET_PARSING = True
\ No newline at end of file
@@ -40,6 +40,10 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Per-connection tuning for maintenance work (nothing here is stored in the
+# database file): fewer fsyncs per commit, in-memory temp tables, 64MB page cache
+SQLITE_PRAGMAS = ("synchronous=NORMAL", "temp_store=MEMORY", "cache_size=-64000")
+
 def get_db_connection():
     """Get a connection to the SQLite database."""
     db_path = os.path.join(project_root, DATABASE_URL)
@@ -51,17 +55,23 @@ def get_db_connection():
     try:
         conn = sqlite3.connect(db_path)
         conn.row_factory = sqlite3.Row
+        for pragma in SQLITE_PRAGMAS:
+            conn.execute(f"PRAGMA {pragma}")
         return conn
     except sqlite3.Error as e:
         logger.error(f"Error connecting to database: {e}")
         sys.exit(1)
 
-def clear_lap_times(conn):
-    """Clear all lap time records from the database."""
+def clear_lap_times(conn, commit=True):
+    """Clear all lap time records from the database.
+    
+    Pass commit=False to leave the change in the caller's open transaction.
+    """
     try:
         cursor = conn.cursor()
         cursor.execute("DELETE FROM lap_times")
-        conn.commit()
+        if commit:
+            conn.commit()
         
         # Get number of rows deleted
         rows_deleted = cursor.rowcount
@@ -73,26 +83,35 @@ def clear_lap_times(conn):
         conn.rollback()
         return False
 
-def clear_rig_assignments(conn):
-    """Clear rig assignments and reset to defaults."""
+def clear_rig_assignments(conn, commit=True):
+    """Clear rig assignments and reset to defaults.
+    
+    Pass commit=False to leave the change in the caller's open transaction.
+    """
     try:
         cursor = conn.cursor()
         
-        # First check if we need to create the default rigs
-        cursor.execute("SELECT COUNT(*) FROM rigs")
-        rig_count = cursor.fetchone()[0]
-        
-        # Clear current assignments
-        cursor.execute("DELETE FROM rigs")
+        # Reset default rigs in place (keeping their ids) in one prepared statement
+        cursor.executemany(
+            """
+            INSERT INTO rigs (rig_identifier, current_player_name) VALUES (?, ?)
+            ON CONFLICT(rig_identifier) DO UPDATE SET
+                current_player_name = excluded.current_player_name,
+                phone_number = '',
+                email = ''
+            """,
+            DEFAULT_RIG_NAMES.items()
+        )
         
-        # Re-create default rig assignments
-        for rig_id, default_name in DEFAULT_RIG_NAMES.items():
-            cursor.execute(
-                "INSERT INTO rigs (rig_identifier, current_player_name) VALUES (?, ?)",
-                (rig_id, default_name)
-            )
+        # Drop any rigs that are not part of the default set
+        placeholders = ", ".join("?" * len(DEFAULT_RIG_NAMES))
+        cursor.execute(
+            f"DELETE FROM rigs WHERE rig_identifier NOT IN ({placeholders})",
+            tuple(DEFAULT_RIG_NAMES)
+        )
             
-        conn.commit()
+        if commit:
+            conn.commit()
         logger.info(f"Reset {len(DEFAULT_RIG_NAMES)} rig assignments to default values")
         
         return True
@@ -102,16 +121,18 @@ def clear_rig_assignments(conn):
         return False
 
 def reset_all(conn):
-    """Reset the entire database to initial state."""
-    success = True
+    """Reset the entire database to initial state in a single transaction."""
+    conn.execute("BEGIN")
     
-    if not clear_lap_times(conn):
-        success = False
-        
-    if not clear_rig_assignments(conn):
-        success = False
+    # The helpers roll back the whole transaction on failure
+    if not clear_lap_times(conn, commit=False):
+        return False
         
-    return success
+    if not clear_rig_assignments(conn, commit=False):
+        return False
+    
+    conn.commit()
+    return True
 
 def main():
     parser = argparse.ArgumentParser(
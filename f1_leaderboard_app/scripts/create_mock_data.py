@@ -6,13 +6,14 @@ Create mock F1 leaderboard data for testing Supabase sync.
 import os
 import sys
 import random
+import zlib
 from datetime import datetime, timedelta
 
 # Add the project root to the Python path
 root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.append(root_dir)
 
-from backend.database.db_manager import add_lap_time, assign_player_to_rig, get_db_connection
+from backend.database.db_manager import assign_player_to_rig, bulk_add_lap_times, get_db_connection
 
 # Mock player data
 MOCK_PLAYERS = [
@@ -26,6 +27,13 @@ MOCK_PLAYERS = [
     {"name": "Maria Garcia", "phone": "+1-555-0108", "email": "maria.garcia@email.com"},
 ]
 
+# Skill-based consistency per player (some players are consistently faster): +/- 1 second variation.
+# crc32 rather than hash(), which is salted per process, so seeded runs match
+SKILL_MOD = {p["name"]: (zlib.crc32(p["name"].encode()) % 1000 - 500) * 2 for p in MOCK_PLAYERS}
+
+# Dedicated generator for mock data; set MOCK_DATA_SEED for reproducible runs
+rng = random.Random(os.environ.get("MOCK_DATA_SEED"))
+
 # Mock tracks with realistic lap time ranges (in milliseconds)
 TRACK_LAP_TIMES = {
     "Bahrain International Circuit": (88000, 95000),  # 1:28 - 1:35
@@ -37,71 +45,96 @@ TRACK_LAP_TIMES = {
     "Circuit Gilles Villeneuve": (75000, 82000),     # 1:15 - 1:22
 }
 
-def create_mock_data():
-    """Create mock F1 leaderboard data."""
+def create_mock_data(conn, verbose=False):
+    """Create mock F1 leaderboard data using the given database connection.
+    
+    Args:
+        conn (sqlite3.Connection): Open database connection
+        verbose (bool, optional): List every created lap time
+    
+    Returns:
+        bool: True if the data was created, False if a rig assignment failed
+    """
     print("Creating mock F1 leaderboard data...")
     
-    # Assign players to rigs with contact info
+    # Assign players to rigs with contact info, all in one transaction
     rigs = ["RIG1", "RIG2", "RIG3", "RIG4"]
+    conn.execute("BEGIN")
     for i, rig in enumerate(rigs):
         if i < len(MOCK_PLAYERS):
             player = MOCK_PLAYERS[i]
-            assign_player_to_rig(
-                rig, 
-                player["name"], 
-                player["phone"], 
-                player["email"]
-            )
+            if not assign_player_to_rig(rig, player["name"], player["phone"], player["email"], conn=conn):
+                # Undo the assignments made so far instead of generating laps against a partial setup
+                conn.rollback()
+                print(f"❌ Rig not found: {rig}; no mock data created")
+                return False
             print(f"Assigned {player['name']} to {rig}")
+    conn.commit()
     
-    # Create lap times for multiple tracks
-    created_count = 0
+    # Generate lap times for multiple tracks, drawing each track's players,
+    # base times and rigs in one go
+    rows = []
     for track_name, (min_time, max_time) in TRACK_LAP_TIMES.items():
-        print(f"Creating lap times for {track_name}...")
-        
         # Create 6-8 lap times per track
-        num_times = random.randint(6, 8)
-        selected_players = random.sample(MOCK_PLAYERS, num_times)
+        num_times = rng.randint(6, 8)
+        names = [player["name"] for player in rng.sample(MOCK_PLAYERS, num_times)]
+        base_times = [rng.randint(min_time, max_time) for _ in range(num_times)]
+        rig_picks = rng.choices(rigs, k=num_times)
         
-        for player in selected_players:
-            # Generate realistic lap time with some variation
-            base_time = random.randint(min_time, max_time)
-            
-            # Add some skill-based consistency (some players are consistently faster)
-            player_skill = hash(player["name"]) % 1000
-            skill_modifier = (player_skill - 500) * 2  # +/- 1 second variation
-            lap_time_ms = max(min_time, base_time + skill_modifier)
-            
-            # Random rig assignment
-            rig = random.choice(rigs)
-            
-            success = add_lap_time(rig, track_name, player["name"], lap_time_ms)
-            if success:
-                created_count += 1
-                # Format time for display
-                minutes = lap_time_ms // 60000
-                seconds = (lap_time_ms % 60000) // 1000
-                millis = lap_time_ms % 1000
-                time_str = f"{minutes}:{seconds:02d}.{millis:03d}"
-                print(f"  - {player['name']}: {time_str} ({rig})")
+        # Skill modifier gives some consistency (some players are consistently faster)
+        rows.extend(
+            (rig, track_name, name, max(min_time, base_time + SKILL_MOD[name]))
+            for rig, name, base_time in zip(rig_picks, names, base_times)
+        )
+    
+    # Insert every lap time in a single transaction
+    inserted = bulk_add_lap_times(rows, conn)
+    created_count = len(inserted)
+    
+    if verbose:
+        # Build the listing first and write it to the console in one go
+        log_lines = []
+        current_track = None
+        for rig, track_name, player_name, lap_time_ms in inserted:
+            if track_name != current_track:
+                current_track = track_name
+                log_lines.append(f"Created lap times for {track_name}:")
+            # Format time for display
+            minutes = lap_time_ms // 60000
+            seconds = (lap_time_ms % 60000) // 1000
+            millis = lap_time_ms % 1000
+            time_str = f"{minutes}:{seconds:02d}.{millis:03d}"
+            log_lines.append(f"  - {player_name}: {time_str} ({rig})")
+        print("\n".join(log_lines))
     
     print(f"\n✅ Created {created_count} mock lap times across {len(TRACK_LAP_TIMES)} tracks!")
     print("Mock data is ready for Supabase sync testing.")
+    return True
 
-def clear_existing_data():
-    """Clear existing lap times (but keep rigs and tracks)."""
+def clear_existing_data(conn=None):
+    """Clear existing lap times (but keep rigs and tracks).
+    
+    Args:
+        conn (sqlite3.Connection, optional): Connection to reuse; a new one is opened and closed if omitted
+    """
     print("Clearing existing lap time data...")
-    conn = get_db_connection()
+    own_conn = conn is None
+    if own_conn:
+        conn = get_db_connection()
     try:
         conn.execute("DELETE FROM lap_times")
         conn.commit()
         print("✅ Cleared existing lap times")
     finally:
-        conn.close()
+        if own_conn:
+            conn.close()
 
 if __name__ == "__main__":
-    if len(sys.argv) > 1 and sys.argv[1] == "--clear":
-        clear_existing_data()
-    else:
-        clear_existing_data()  # Clear first
-        create_mock_data()
\ No newline at end of file
+    # One connection for the whole run keeps SQLite's page cache warm
+    conn = get_db_connection()
+    try:
+        clear_existing_data(conn)  # Clear first
+        success = "--clear" in sys.argv[1:] or create_mock_data(conn, verbose="--verbose" in sys.argv[1:])
+    finally:
+        conn.close()
+    sys.exit(0 if success else 1)
\ No newline at end of file
@@ -29,6 +29,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Schema version recorded in PRAGMA user_version (2 = rigs have phone_number/email)
+SCHEMA_VERSION = 2
+
 def migrate_existing_database():
     """
     Migrate existing database to add new columns if they don't exist.
@@ -36,12 +39,20 @@ def migrate_existing_database():
     try:
         conn = get_db_connection()
         
+        # Already migrated databases only need the 4-byte header read
+        if conn.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION:
+            logger.info("Database schema is already up to date.")
+            return
+        
         # Check if the new columns exist
         cursor = conn.execute("PRAGMA table_info(rigs)")
-        columns = [column[1] for column in cursor.fetchall()]
+        columns = {column[1] for column in cursor.fetchall()}
         
         needs_migration = False
         
+        # Apply all schema changes in one transaction (one commit, one fsync)
+        conn.execute("BEGIN")
+        
         # Add phone_number column if it doesn't exist
         if 'phone_number' not in columns:
             logger.info("Adding phone_number column to rigs table...")
@@ -54,8 +65,10 @@ def migrate_existing_database():
             conn.execute("ALTER TABLE rigs ADD COLUMN email TEXT DEFAULT ''")
             needs_migration = True
         
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        conn.commit()
+        
         if needs_migration:
-            conn.commit()
             logger.info("Database migration completed successfully.")
         else:
             logger.info("Database schema is already up to date.")
@@ -87,6 +100,11 @@ def main():
             logger.info("Existing database detected, checking for migrations...")
             migrate_existing_database()
         else:
+            conn = get_db_connection()
+            try:
+                conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            finally:
+                conn.close()
             logger.info("New database created with latest schema.")
         
         logger.info("Database initialization completed successfully.")
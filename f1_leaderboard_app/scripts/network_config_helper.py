@@ -13,8 +13,11 @@ Usage:
 """
 
 import os
+import re
 import sys
+import string
 import argparse
+from pathlib import Path
 
 # Add project root to path
 script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -23,6 +26,9 @@ sys.path.append(project_root)
 
 from config.app_config import NETWORK_CONFIG, SHOP_NETWORK, MOBILE_NETWORK, NETWORK_PROFILE
 
+# Matches the NETWORK_PROFILE assignment rewritten by set_profile
+_PROFILE_RE = re.compile(r'NETWORK_PROFILE = "[^"]*"')
+
 def show_current_config():
     """Display the current network configuration."""
     print(f"\n=== F1 Leaderboard Network Configuration ===")
@@ -63,22 +69,17 @@ def set_profile(profile_name):
         print(f"Error: Invalid profile '{profile_name}'. Valid profiles: SHOP, MOBILE")
         return
         
-    # Read the current config file
     config_path = os.path.join(project_root, "config", "app_config.py")
-    
-    with open(config_path, 'r') as f:
-        content = f.read()
-    
-    # Replace the NETWORK_PROFILE line
-    import re
-    pattern = r'NETWORK_PROFILE = "[^"]*"'
     replacement = f'NETWORK_PROFILE = "{profile_name}"'
     
-    new_content = re.sub(pattern, replacement, content)
-    
-    # Write back the modified content
-    with open(config_path, 'w') as f:
-        f.write(new_content)
+    # Replace the NETWORK_PROFILE line in place
+    with open(config_path, 'r+') as f:
+        content = f.read()
+        new_content = _PROFILE_RE.sub(replacement, content, count=1)
+        if new_content != content:
+            f.seek(0)
+            f.write(new_content)
+            f.truncate()
     
     print(f"\n✅ Network profile switched to: {profile_name}")
     print(f"📝 Remember to:")
@@ -86,28 +87,17 @@ def set_profile(profile_name):
     print(f"   2. Update static IPs on all rig PCs")
     print(f"   3. Generate new batch files if needed")
 
-def generate_batch_config(rig_id):
-    """Generate a batch file to configure static IP for a rig."""
-    rig_id = rig_id.upper()
-    
-    if rig_id not in NETWORK_CONFIG['rig_ips']:
-        print(f"Error: Unknown rig ID '{rig_id}'. Valid IDs: {list(NETWORK_CONFIG['rig_ips'].keys())}")
-        return
-    
-    rig_ip = NETWORK_CONFIG['rig_ips'][rig_id]
-    gateway = NETWORK_CONFIG['gateway']
-    profile_name = NETWORK_PROFILE
-    
-    batch_content = f"""@echo off
+# Static IP setup script for one rig, shared by single and bulk generation
+_BATCH_TMPL = string.Template("""@echo off
 echo ==========================================
 echo F1 Leaderboard - Network Configuration
-echo Profile: {profile_name} ({NETWORK_CONFIG['name']})
-echo Rig: {rig_id}
+echo Profile: $profile ($network_name)
+echo Rig: $rig_id
 echo ==========================================
 echo.
-echo Setting IP: {rig_ip}
-echo Gateway: {gateway}
-echo Subnet: {NETWORK_CONFIG['subnet_mask']}
+echo Setting IP: $rig_ip
+echo Gateway: $gateway
+echo Subnet: $subnet_mask
 echo.
 
 REM Get the network adapter name
@@ -119,26 +109,46 @@ echo Configuring adapter: %adapter_name%
 echo.
 
 REM Set static IP
-netsh interface ip set address name="%adapter_name%" static {rig_ip} {NETWORK_CONFIG['subnet_mask']} {gateway}
+netsh interface ip set address name="%adapter_name%" static $rig_ip $subnet_mask $gateway
 
 REM Set DNS (Google's public DNS)
 netsh interface ip set dns name="%adapter_name%" static 8.8.8.8
 netsh interface ip add dns name="%adapter_name%" 8.8.4.4 index=2
 
 echo.
-echo ✅ Network configuration complete for {rig_id}!
-echo Profile: {profile_name}
-echo IP: {rig_ip}
-echo Gateway: {gateway}
+echo ✅ Network configuration complete for $rig_id!
+echo Profile: $profile
+echo IP: $rig_ip
+echo Gateway: $gateway
 echo.
-echo The rig is now configured for: {NETWORK_CONFIG['name']}
+echo The rig is now configured for: $network_name
 echo.
 pause
-"""
+""".replace("\n", "\r\n"))  # Batch files want CRLF line endings
+
+def _write_batch(rig_id, profile, config):
+    """Write the network setup batch file for a rig and return its filename."""
+    filename = f"setup_network_{rig_id}_{profile}.bat"
+    batch_content = _BATCH_TMPL.substitute(
+        profile=profile,
+        network_name=config['name'],
+        rig_id=rig_id,
+        rig_ip=config['rig_ips'][rig_id],
+        gateway=config['gateway'],
+        subnet_mask=config['subnet_mask'],
+    )
+    Path(filename).write_bytes(batch_content.encode("utf-8"))
+    return filename
+
+def generate_batch_config(rig_id):
+    """Generate a batch file to configure static IP for a rig."""
+    rig_id = rig_id.upper()
     
-    filename = f"setup_network_{rig_id}_{profile_name}.bat"
-    with open(filename, 'w') as f:
-        f.write(batch_content)
+    if rig_id not in NETWORK_CONFIG['rig_ips']:
+        print(f"Error: Unknown rig ID '{rig_id}'. Valid IDs: {list(NETWORK_CONFIG['rig_ips'].keys())}")
+        return
+    
+    filename = _write_batch(rig_id, NETWORK_PROFILE, NETWORK_CONFIG)
     
     print(f"\n✅ Generated: {filename}")
     print(f"📋 Run this batch file as administrator on the {rig_id} PC")
@@ -164,50 +174,7 @@ def generate_all_batch_files():
             if rig_id not in config['rig_ips']:
                 continue
                 
-            rig_ip = config['rig_ips'][rig_id]
-            gateway = config['gateway']
-            
-            batch_content = f"""@echo off
-echo ==========================================
-echo F1 Leaderboard - Network Configuration
-echo Profile: {profile} ({config['name']})
-echo Rig: {rig_id}
-echo ==========================================
-echo.
-echo Setting IP: {rig_ip}
-echo Gateway: {gateway}
-echo Subnet: {config['subnet_mask']}
-echo.
-
-REM Get the network adapter name
-for /f "tokens=1,2*" %%i in ('netsh interface show interface ^| findstr /C:"Connected"') do (
-    set adapter_name=%%k
-)
-
-echo Configuring adapter: %adapter_name%
-echo.
-
-REM Set static IP
-netsh interface ip set address name="%adapter_name%" static {rig_ip} {config['subnet_mask']} {gateway}
-
-REM Set DNS (Google's public DNS)
-netsh interface ip set dns name="%adapter_name%" static 8.8.8.8
-netsh interface ip add dns name="%adapter_name%" 8.8.4.4 index=2
-
-echo.
-echo ✅ Network configuration complete for {rig_id}!
-echo Profile: {profile}
-echo IP: {rig_ip}
-echo Gateway: {gateway}
-echo.
-echo The rig is now configured for: {config['name']}
-echo.
-pause
-"""
-            
-            filename = f"setup_network_{rig_id}_{profile}.bat"
-            with open(filename, 'w') as f:
-                f.write(batch_content)
+            filename = _write_batch(rig_id, profile, config)
             
             print(f"   ✅ {filename}")
     
@@ -215,6 +182,18 @@ pause
     print(f"📦 Include these files in your installer package.")
     print(f"🔧 Operators can run the appropriate files based on their network profile.")
 
+# Command-line options mapped to their handlers: flags take no argument,
+# value options receive the option's value
+ACTIONS = {
+    "show_current": show_current_config,
+    "show_all": show_all_profiles,
+    "generate_all": generate_all_batch_files,
+}
+VALUE_ACTIONS = {
+    "set_profile": set_profile,
+    "generate_batch": generate_batch_config,
+}
+
 def main():
     parser = argparse.ArgumentParser(description="F1 Leaderboard Network Configuration Helper")
     parser.add_argument('--show-current', action='store_true', help='Show current network configuration')
@@ -225,16 +204,15 @@ def main():
     
     args = parser.parse_args()
     
-    if args.show_current:
-        show_current_config()
-    elif args.show_all:
-        show_all_profiles()
-    elif args.set_profile:
-        set_profile(args.set_profile)
-    elif args.generate_batch:
-        generate_batch_config(args.generate_batch)
-    elif args.generate_all:
-        generate_all_batch_files()
+    # Options are checked in the order they were added; the first one set wins
+    for option, value in vars(args).items():
+        if not value:
+            continue
+        if option in ACTIONS:
+            ACTIONS[option]()
+        else:
+            VALUE_ACTIONS[option](value)
+        break
     else:
         # Show help and current config by default
         show_current_config()
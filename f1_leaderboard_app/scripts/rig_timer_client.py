@@ -8,13 +8,35 @@ This script runs on each simulator rig PC and provides:
 - Automatic ESC key sending when timer expires
 """
 
+import os
 import tkinter as tk
 import threading
-import time
+import ctypes
 import argparse
 import sys
 import logging
-from flask import Flask, request, jsonify
+import time
+from dataclasses import dataclass
+from flask import Flask, request
+
+# Add the project root to the Python path
+root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(root_dir)
+
+from config.utils import json_dumps
+
+# waitress is optional; it serves concurrent admin requests far better than
+# Flask's built-in development server
+try:
+    from waitress import serve as waitress_serve
+except ImportError:
+    waitress_serve = None
+
+# Pillow is optional; without it the overlay shows a text logo
+try:
+    from PIL import Image, ImageTk
+except ImportError:
+    Image = ImageTk = None
 
 # Import the timer functionality from our working timer_app
 try:
@@ -30,6 +52,9 @@ logger = logging.getLogger(__name__)
 # Configuration
 DEFAULT_HOST = '0.0.0.0'
 DEFAULT_PORT = 5001
+WAITRESS_THREADS = 2
+ESC_DEBOUNCE_SECONDS = 0.5  # Repeated /press_esc calls within this window are coalesced
+ESC_HOLD_MS = 50  # Games that poll key state can miss a zero-length press
 WINDOW_WIDTH = 200
 WINDOW_HEIGHT = 80
 WINDOW_POSITION_X_OFFSET = 50
@@ -38,278 +63,358 @@ FONT_SETTINGS = ("Arial", 30, "bold")
 TRANSPARENT_COLOR = 'grey15'
 TEXT_COLOR = 'white'
 BACKGROUND_COLOR = TRANSPARENT_COLOR
+LOGO_PATH = os.path.join(os.path.dirname(__file__), "../backend/static/images/Logo + Slogan Gri.png")
+LOGO_SIZE = (400, 200)
+
+# SendInput constants for the ESC key press
+INPUT_KEYBOARD = 1
+KEYEVENTF_SCANCODE = 0x0008
+KEYEVENTF_KEYUP = 0x0002
+ESC_SCANCODE = 0x01
+
+class _KeyBdInput(ctypes.Structure):
+    _fields_ = [("wVk", ctypes.c_ushort), ("wScan", ctypes.c_ushort), ("dwFlags", ctypes.c_ulong),
+                ("time", ctypes.c_ulong), ("dwExtraInfo", ctypes.POINTER(ctypes.c_ulong))]
+
+class _MouseInput(ctypes.Structure):
+    _fields_ = [("dx", ctypes.c_long), ("dy", ctypes.c_long), ("mouseData", ctypes.c_ulong),
+                ("dwFlags", ctypes.c_ulong), ("time", ctypes.c_ulong), ("dwExtraInfo", ctypes.POINTER(ctypes.c_ulong))]
+
+class _HardwareInput(ctypes.Structure):
+    _fields_ = [("uMsg", ctypes.c_ulong), ("wParamL", ctypes.c_short), ("wParamH", ctypes.c_ushort)]
 
-# Global variables for timer state
-timer_active = False
-remaining_time = 0
-timer_thread = None
-root = None
-timer_label = None
-rig_identifier = None
-company_overlay = None  # Track the overlay window
+class _InputUnion(ctypes.Union):
+    _fields_ = [("ki", _KeyBdInput), ("mi", _MouseInput), ("hi", _HardwareInput)]
+
+class _Input(ctypes.Structure):
+    _fields_ = [("type", ctypes.c_ulong), ("ii", _InputUnion)]
+
+# ESC keydown and keyup inputs built once; each is a single SendInput call
+try:
+    _send_input = ctypes.windll.user32.SendInput
+    _esc_extra = ctypes.c_ulong(0)
+    _esc_down = _Input(INPUT_KEYBOARD, _InputUnion(ki=_KeyBdInput(0, ESC_SCANCODE, KEYEVENTF_SCANCODE, 0, ctypes.pointer(_esc_extra))))
+    _esc_up = _Input(INPUT_KEYBOARD, _InputUnion(ki=_KeyBdInput(0, ESC_SCANCODE, KEYEVENTF_SCANCODE | KEYEVENTF_KEYUP, 0, ctypes.pointer(_esc_extra))))
+except AttributeError:  # Not on Windows
+    _send_input = None
+
+# Timer and GUI state, shared between the HTTP handler threads and the Tk thread
+@dataclass
+class TimerState:
+    rig_identifier: str = None
+    active: bool = False
+    remaining: int = 0
+    generation: int = 0  # Bumped per countdown so stale Tk ticks drop out
+    root: tk.Tk = None
+    timer_label: tk.Label = None
+    time_var: tk.StringVar = None  # Bound to timer_label's textvariable
+    company_overlay: tk.Toplevel = None  # Overlay window, built hidden in setup_gui
+    overlay_visible: bool = False
+    company_logo: object = None  # Logo PhotoImage, loaded once in setup_gui
+    status_cache: tuple = (None, b"")  # ((active, remaining), serialized /status body)
+    last_esc_press: float = float('-inf')  # time.monotonic() of the last admin ESC press
+
+state = TimerState()
+_state_lock = threading.Lock()  # Guards active/remaining/generation updates
 
 # Flask App
 app = Flask(__name__)
 
 def run_flask_app(host, port):
-    """Run the Flask server."""
-    app.run(host=host, port=port, debug=False, threaded=True, use_reloader=False)
+    """Run the Flask server (waitress if installed, otherwise Flask's own server)."""
+    if waitress_serve:
+        waitress_serve(app, host=host, port=port, threads=WAITRESS_THREADS)
+    else:
+        app.run(host=host, port=port, debug=False, threaded=True, use_reloader=False)
+
+def json_response(data, status=200):
+    """Build a JSON response (orjson-encoded when available)."""
+    return app.response_class(json_dumps(data), status=status, mimetype='application/json')
 
 @app.route('/start_timer', methods=['POST'])
 def start_timer_endpoint():
     """Start timer endpoint - receives commands from the admin interface."""
-    global timer_active, remaining_time, timer_thread, root
-    
-    if timer_active:
-        return jsonify({"status": "error", "message": "Timer is already active."}), 400
+    with _state_lock:
+        if state.active:
+            return json_response({"status": "error", "message": "Timer is already active."}, 400)
 
-    data = request.json
-    duration = data.get('duration')
+        data = request.json
+        duration = data.get('duration')
 
-    if duration is None or not isinstance(duration, (int, float)) or duration <= 0:
-        return jsonify({"status": "error", "message": "Invalid duration provided."}), 400
+        if duration is None or not isinstance(duration, (int, float)) or duration <= 0:
+            return json_response({"status": "error", "message": "Invalid duration provided."}, 400)
 
-    remaining_time = int(duration)
-    timer_active = True
+        state.remaining = int(duration)
+        state.active = True
 
-    if root and timer_label:
-        if timer_thread and timer_thread.is_alive():
-            logger.warning("Previous timer thread still alive.")
-    
-        timer_thread = threading.Thread(target=countdown_timer_task, daemon=True)
-        timer_thread.start()
-        logger.info(f"Timer started for {duration} seconds on {rig_identifier}")
-        return jsonify({"status": "success", "message": f"Timer started for {duration} seconds."})
+    if state.root and state.timer_label:
+        # The countdown runs on the Tk event loop; schedule it from this thread
+        state.root.after(0, begin_countdown)
+        logger.info(f"Timer started for {duration} seconds on {state.rig_identifier}")
+        return json_response({"status": "success", "message": f"Timer started for {duration} seconds."})
     else:
-        return jsonify({"status": "error", "message": "GUI not initialized."}), 500
+        return json_response({"status": "error", "message": "GUI not initialized."}, 500)
 
 @app.route('/stop_timer', methods=['POST'])
 def stop_timer_endpoint():
     """Stop timer endpoint - receives commands from the admin interface."""
-    global timer_active, remaining_time, root, timer_label
-
-    if not timer_active:
-        # If already stopped or never started, still return success as the goal is achieved.
-        logger.info(f"Received stop command for {rig_identifier}, but timer was not active.")
-        return jsonify({"status": "success", "message": "Timer was not active or already stopped."})
-
-    timer_active = False # Signal the countdown thread to stop
-    remaining_time = 0   # Reset remaining time
-
-    if root and timer_label:
-        # Hide the window immediately
-        root.after(0, hide_timer_window)
-        # Optionally, update display to show it was stopped, or just hide
-        root.after(0, update_timer_display, "STOPPED") 
-        time.sleep(1) # Give a moment for display update if any, then hide again
-        root.after(0, hide_timer_window)
-
-        logger.info(f"Timer stopped by admin command on {rig_identifier}")
-        return jsonify({"status": "success", "message": f"Timer stopped for {rig_identifier}."})
+    with _state_lock:
+        if not state.active:
+            # If already stopped or never started, still return success as the goal is achieved.
+            logger.debug(f"Received stop command for {state.rig_identifier}, but timer was not active.")
+            return json_response({"status": "success", "message": "Timer was not active or already stopped."})
+
+        state.active = False # Signal the countdown to stop
+        state.remaining = 0  # Reset remaining time
+
+    if state.root and state.timer_label:
+        # Show that the timer was stopped once the GUI is idle, then hide the
+        # window a moment later without holding up the response
+        state.root.after_idle(update_timer_display, "STOPPED")
+        state.root.after(1000, hide_timer_window)
+
+        logger.info(f"Timer stopped by admin command on {state.rig_identifier}")
+        return json_response({"status": "success", "message": f"Timer stopped for {state.rig_identifier}."})
     else:
         # This case should ideally not happen if timer was active
-        logger.warning(f"Stop command received for {rig_identifier}, but GUI not found. Marking inactive.")
-        return jsonify({"status": "success", "message": "Timer marked inactive, GUI not found."})
+        logger.warning(f"Stop command received for {state.rig_identifier}, but GUI not found. Marking inactive.")
+        return json_response({"status": "success", "message": "Timer marked inactive, GUI not found."})
 
 @app.route('/status', methods=['GET'])
 def get_timer_status():
     """Get current timer status."""
-    return jsonify({
-        "rig_identifier": rig_identifier,
-        "timer_active": timer_active,
-        "remaining_time": remaining_time
-    })
+    with _state_lock:
+        key = (state.active, state.remaining)
+    
+    # The body only changes with the timer state, so serialize it once per change
+    cached_key, body = state.status_cache
+    if key != cached_key:
+        body = json_dumps({
+            "rig_identifier": state.rig_identifier,
+            "timer_active": key[0],
+            "remaining_time": key[1]
+        })
+        state.status_cache = (key, body)
+    return app.response_class(body, mimetype='application/json')
 
 @app.route('/dismiss_overlay', methods=['POST'])
 def dismiss_overlay_endpoint():
     """Dismiss company overlay endpoint - receives commands from the admin interface."""
-    global company_overlay
-    
-    if company_overlay:
+    if state.overlay_visible:
         try:
-            company_overlay.destroy()
-            company_overlay = None
-            logger.info(f"Company overlay dismissed by admin command on {rig_identifier}")
-            return jsonify({"status": "success", "message": f"Overlay dismissed for {rig_identifier}."})
+            # Keep the window for the next session; just hide it on the Tk thread
+            state.overlay_visible = False
+            state.root.after(0, state.company_overlay.withdraw)
+            logger.info(f"Company overlay dismissed by admin command on {state.rig_identifier}")
+            return json_response({"status": "success", "message": f"Overlay dismissed for {state.rig_identifier}."})
         except Exception as e:
-            logger.error(f"Error dismissing overlay on {rig_identifier}: {e}")
-            company_overlay = None  # Reset reference even if destroy failed
-            return jsonify({"status": "error", "message": f"Error dismissing overlay: {str(e)}"})
+            logger.error(f"Error dismissing overlay on {state.rig_identifier}: {e}")
+            return json_response({"status": "error", "message": f"Error dismissing overlay: {str(e)}"})
     else:
-        logger.info(f"Received dismiss command for {rig_identifier}, but no overlay was active.")
-        return jsonify({"status": "success", "message": "No overlay was active or already dismissed."})
+        logger.debug(f"Received dismiss command for {state.rig_identifier}, but no overlay was active.")
+        return json_response({"status": "success", "message": "No overlay was active or already dismissed."})
 
 @app.route('/show_overlay', methods=['POST'])
 def show_overlay_endpoint():
     """Show company overlay endpoint - receives commands from the admin interface."""
-    global company_overlay, root
+    if state.overlay_visible:
+        logger.debug(f"Received show overlay command for {state.rig_identifier}, but overlay already active.")
+        return json_response({"status": "success", "message": "Overlay is already active."})
     
-    if company_overlay:
-        logger.info(f"Received show overlay command for {rig_identifier}, but overlay already active.")
-        return jsonify({"status": "success", "message": "Overlay is already active."})
-    
-    if not root:
-        logger.error(f"Received show overlay command for {rig_identifier}, but GUI not initialized.")
-        return jsonify({"status": "error", "message": "GUI not initialized."})
+    if not state.root:
+        logger.error(f"Received show overlay command for {state.rig_identifier}, but GUI not initialized.")
+        return json_response({"status": "error", "message": "GUI not initialized."})
     
     try:
-        # Send ESC key to pause the game first
-        logger.info(f"Sending ESC key for manual session end on {rig_identifier}")
-        try:
-            pydirectinput.press('esc')
-            logger.info("ESC key sent via pydirectinput for manual session end.")
-        except Exception as e:
-            logger.error(f"Error pressing ESC key with pydirectinput: {e}")
-        
-        # Then show the overlay
-        root.after(0, show_company_overlay)
-        logger.info(f"Company overlay triggered by admin command on {rig_identifier}")
-        return jsonify({"status": "success", "message": f"Session ended and overlay shown for {rig_identifier}."})
+        # ESC + overlay both run on the Tk thread; respond without waiting for them
+        state.root.after(0, end_session_and_show_overlay)
+        logger.info(f"Company overlay triggered by admin command on {state.rig_identifier}")
+        return json_response({"status": "success", "message": f"Session ended and overlay shown for {state.rig_identifier}."})
     except Exception as e:
-        logger.error(f"Error showing overlay on {rig_identifier}: {e}")
-        return jsonify({"status": "error", "message": f"Error showing overlay: {str(e)}"})
+        logger.error(f"Error showing overlay on {state.rig_identifier}: {e}")
+        return json_response({"status": "error", "message": f"Error showing overlay: {str(e)}"})
+
+def end_session_and_show_overlay():
+    """Pause the game with ESC, then show the company overlay (runs on the Tk thread)."""
+    logger.info(f"Sending ESC key for manual session end on {state.rig_identifier}")
+    try:
+        press_esc()
+        logger.debug("ESC key sent for manual session end.")
+    except Exception as e:
+        logger.error(f"Error pressing ESC key: {e}")
+    
+    show_company_overlay()
 
 @app.route('/press_esc', methods=['POST'])
 def press_esc_endpoint():
     """Press ESC key endpoint - simple utility command from the admin interface."""
+    # A double-click in the admin UI shouldn't pause and unpause the game
+    now = time.monotonic()
+    with _state_lock:
+        if now - state.last_esc_press < ESC_DEBOUNCE_SECONDS:
+            logger.debug(f"Ignoring repeated ESC command on {state.rig_identifier}")
+            return json_response({"status": "success", "message": "ESC key press coalesced with the previous one."})
+        state.last_esc_press = now
+    
     try:
-        logger.info(f"Pressing ESC key on {rig_identifier} by admin command")
-        pydirectinput.press('esc')
-        logger.info("ESC key sent via pydirectinput.")
-        return jsonify({"status": "success", "message": f"ESC key pressed on {rig_identifier}."})
+        logger.info(f"Pressing ESC key on {state.rig_identifier} by admin command")
+        press_esc()
+        logger.debug("ESC key sent.")
+        return json_response({"status": "success", "message": f"ESC key pressed on {state.rig_identifier}."})
     except Exception as e:
-        logger.error(f"Error pressing ESC key on {rig_identifier}: {e}")
-        return jsonify({"status": "error", "message": f"Error pressing ESC key: {str(e)}"})
-
-def countdown_timer_task():
-    """Main countdown timer logic."""
-    global remaining_time, timer_active, timer_label
-
-    logger.info(f"Timer started: {remaining_time} seconds on {rig_identifier}")
-    while remaining_time > 0 and timer_active:
-        if timer_label:
-            root.after(0, update_timer_display, format_time(remaining_time))
-        time.sleep(1)
-        remaining_time -= 1
-
-    if timer_active:
-        root.after(0, update_timer_display, "TIME UP!")
-        logger.info(f"Time's up on {rig_identifier}! Sending ESC key.")
+        logger.error(f"Error pressing ESC key on {state.rig_identifier}: {e}")
+        return json_response({"status": "error", "message": f"Error pressing ESC key: {str(e)}"})
+
+def begin_countdown():
+    """Start a new countdown on the Tk event loop."""
+    with _state_lock:
+        state.generation += 1
+        generation, remaining = state.generation, state.remaining
+    logger.debug(f"Timer started: {remaining} seconds on {state.rig_identifier}")
+    countdown_tick(generation)
+
+def countdown_tick(generation, elapsed=False):
+    """Main countdown timer logic, re-scheduled every second with root.after."""
+    with _state_lock:
+        if generation != state.generation:
+            return  # Superseded by a newer countdown
+
+        if elapsed and state.active:
+            state.remaining -= 1
+
+        remaining, active = state.remaining, state.active
+        if remaining <= 0 or not active:
+            state.active = False
+            state.remaining = 0
+
+    if remaining > 0 and active:
+        update_timer_display(format_time(remaining))
+        state.root.after(1000, countdown_tick, generation, True)
+        return
+
+    if active:
+        update_timer_display("TIME UP!")
+        logger.info(f"Time's up on {state.rig_identifier}! Sending ESC key.")
         try:
-            pydirectinput.press('esc')
-            logger.info("ESC key sent via pydirectinput.")
+            press_esc()
+            logger.debug("ESC key sent.")
         except Exception as e:
-            logger.error(f"Error pressing ESC key with pydirectinput: {e}")
+            logger.error(f"Error pressing ESC key: {e}")
         
-        root.after(0, show_company_overlay)  # Show full-screen company overlay immediately
-        time.sleep(3) 
-        root.after(0, hide_timer_window)
+        show_company_overlay()  # Show full-screen company overlay immediately
+        state.root.after(3000, hide_timer_window)
 
-    timer_active = False
-    remaining_time = 0
-    logger.info(f"Timer finished on {rig_identifier}")
+    logger.info(f"Timer finished on {state.rig_identifier}")
+
+# Pre-formatted MM:SS strings for countdowns up to two hours
+_FMT_CACHE = tuple(f"{s // 60:02d}:{s % 60:02d}" for s in range(7201))
+
+def press_esc():
+    """Send an ESC key press to the focused game window, holding it for ESC_HOLD_MS."""
+    if not _send_input:
+        pydirectinput.press('esc')
+        return
+    
+    _send_input(1, ctypes.byref(_esc_down), ctypes.sizeof(_Input))
+    if state.root:
+        # Release from the Tk event loop rather than sleeping in the caller
+        state.root.after(ESC_HOLD_MS, release_esc)
+    else:
+        time.sleep(ESC_HOLD_MS / 1000)
+        release_esc()
+
+def release_esc():
+    """Send the ESC keyup that completes press_esc()."""
+    _send_input(1, ctypes.byref(_esc_up), ctypes.sizeof(_Input))
 
 def format_time(seconds):
     """Format seconds to MM:SS display."""
+    if 0 <= seconds < len(_FMT_CACHE):
+        return _FMT_CACHE[seconds]
     mins = seconds // 60
     secs = seconds % 60
     return f"{mins:02d}:{secs:02d}"
 
 def update_timer_display(time_str):
     """Update the timer display."""
-    global timer_label, root
-    if timer_label:
-        timer_label.config(text=time_str)
-    if root and not root.winfo_viewable():
-        root.deiconify()
+    if state.time_var:
+        state.time_var.set(time_str)
+    if state.root and not state.root.winfo_viewable():
+        state.root.deiconify()
 
 def hide_timer_window():
     """Hide the timer window."""
-    global root
-    if root:
-        root.withdraw()
-
-def ensure_window_visible():
-    """Ensure timer window is visible."""
-    global root
-    if root and not root.winfo_viewable():
-        root.deiconify()
+    if state.root:
+        state.root.withdraw()
+
+def load_company_logo():
+    """Load and resize the company logo once; returns None if it can't be loaded."""
+    if Image is None:
+        logger.warning("Pillow not installed; the overlay will show a text logo")
+        return None
+    try:
+        return ImageTk.PhotoImage(Image.open(LOGO_PATH).resize(LOGO_SIZE))
+    except Exception as e:
+        logger.warning(f"Could not load logo image: {e}")
+        return None
 
 def setup_gui():
     """Set up the timer GUI."""
-    global root, timer_label
-
-    root = tk.Tk()
-    root.title(f"Rig Timer - {rig_identifier}")
-    root.attributes('-alpha', 0.85)
-    root.attributes('-topmost', True)
-    root.overrideredirect(True)
-    root.attributes('-transparentcolor', TRANSPARENT_COLOR)
-
-    screen_width = root.winfo_screenwidth()
-    screen_height = root.winfo_screenheight()
+    state.root = tk.Tk()
+    state.root.title(f"Rig Timer - {state.rig_identifier}")
+    state.root.attributes('-alpha', 0.85)
+    state.root.attributes('-topmost', True)
+    state.root.overrideredirect(True)
+    state.root.attributes('-transparentcolor', TRANSPARENT_COLOR)
+
+    screen_width = state.root.winfo_screenwidth()
+    screen_height = state.root.winfo_screenheight()
     
     x_pos = screen_width - WINDOW_WIDTH - WINDOW_POSITION_X_OFFSET
     y_pos = WINDOW_POSITION_Y_OFFSET
 
-    root.geometry(f"{WINDOW_WIDTH}x{WINDOW_HEIGHT}+{x_pos}+{y_pos}")
-    root.configure(bg=TRANSPARENT_COLOR)
-
-    timer_label = tk.Label(root, text="00:00", font=FONT_SETTINGS, fg=TEXT_COLOR, bg=BACKGROUND_COLOR)
-    timer_label.pack(expand=True, fill='both')
-    
-    root.withdraw()
-
-    def check_and_show_window():
-        if timer_active and not root.winfo_viewable():
-            ensure_window_visible()
-        root.after(1000, check_and_show_window)
-
-    root.after(1000, check_and_show_window)
-    root.mainloop()
+    state.root.geometry(f"{WINDOW_WIDTH}x{WINDOW_HEIGHT}+{x_pos}+{y_pos}")
+    state.root.configure(bg=TRANSPARENT_COLOR)
 
-def show_company_overlay():
-    """Show full-screen company overlay when timer expires."""
-    global root, company_overlay
+    state.time_var = tk.StringVar(state.root, value="00:00")
+    state.timer_label = tk.Label(state.root, textvariable=state.time_var, font=FONT_SETTINGS, fg=TEXT_COLOR, bg=BACKGROUND_COLOR)
+    state.timer_label.pack(expand=True, fill='both')
     
-    if not root:
-        return
-    
-    # If overlay already exists, don't create another
-    if company_overlay:
-        return
+    # Decode the logo and lay out the overlay now so showing it doesn't stall the GUI
+    state.company_logo = load_company_logo()
+    state.company_overlay = build_company_overlay()
     
-    # Create overlay window
-    company_overlay = tk.Toplevel(root)
-    company_overlay.title("Session Complete")
-    company_overlay.attributes('-fullscreen', True)
-    company_overlay.attributes('-topmost', True)
-    company_overlay.configure(bg='#1a1a1a')  # Dark background
-    company_overlay.overrideredirect(True)
+    # Hidden until a countdown starts; every countdown tick re-shows it via
+    # update_timer_display, so no separate visibility poll is needed
+    state.root.withdraw()
+    state.root.mainloop()
+
+def build_company_overlay():
+    """Build the full-screen company overlay, hidden until a session ends.
+
+    Returns:
+        tk.Toplevel: The withdrawn overlay window
+    """
+    overlay = tk.Toplevel(state.root)
+    overlay.withdraw()
+    overlay.title("Session Complete")
+    overlay.attributes('-fullscreen', True)
+    overlay.attributes('-topmost', True)
+    overlay.configure(bg='#1a1a1a')  # Dark background
+    overlay.overrideredirect(True)
     
     # Main container
-    main_frame = tk.Frame(company_overlay, bg='#1a1a1a')
+    main_frame = tk.Frame(overlay, bg='#1a1a1a')
     main_frame.pack(expand=True, fill='both')
     
     # Company logo/name
-    try:
-        # Load the logo image
-        from PIL import Image, ImageTk
-        import os
-        logo_path = os.path.join(os.path.dirname(__file__), "../backend/static/images/Logo + Slogan Gri.png")
-        logo_image = Image.open(logo_path)
-        logo_image = logo_image.resize((400, 200))  # Adjust size as needed
-        logo_photo = ImageTk.PhotoImage(logo_image)
-        
+    if state.company_logo:
         logo_label = tk.Label(
             main_frame,
-            image=logo_photo,
+            image=state.company_logo,
             bg='#1a1a1a'
         )
-        logo_label.image = logo_photo  # Keep a reference
-        
-    except Exception as e:
-        logger.warning(f"Could not load logo image: {e}")
+    else:
         # Fallback to text
         logo_label = tk.Label(
             main_frame,
@@ -341,30 +446,38 @@ def show_company_overlay():
     )
     instruction_label.pack(pady=(0, 100))
     
-    logger.info(f"Company overlay displayed on {rig_identifier} (operator dismissal only)")
+    return overlay
+
+def show_company_overlay():
+    """Show full-screen company overlay when timer expires."""
+    if not state.company_overlay or state.overlay_visible:
+        return
+    
+    state.company_overlay.deiconify()
+    state.company_overlay.lift()
+    state.overlay_visible = True
+    logger.info(f"Company overlay displayed on {state.rig_identifier} (operator dismissal only)")
 
 def main():
     """Main entry point."""
-    global rig_identifier
-    
     parser = argparse.ArgumentParser(description='F1 Leaderboard Rig Timer Client')
     parser.add_argument('--rig-id', required=True, help='Rig identifier (e.g., RIG1, RIG2, etc.)')
     parser.add_argument('--host', default=DEFAULT_HOST, help=f'Host to bind to (default: {DEFAULT_HOST})')
     parser.add_argument('--port', type=int, default=DEFAULT_PORT, help=f'Port to bind to (default: {DEFAULT_PORT})')
     
     args = parser.parse_args()
-    rig_identifier = args.rig_id
+    state.rig_identifier = args.rig_id
     
-    logger.info(f"Starting F1 Leaderboard Timer Client for {rig_identifier}")
+    logger.info(f"Starting F1 Leaderboard Timer Client for {state.rig_identifier}")
     logger.info(f"Server will listen on {args.host}:{args.port}")
     
     # Start Flask app in a separate thread
     flask_thread = threading.Thread(target=run_flask_app, args=(args.host, args.port), daemon=True)
     flask_thread.start()
-    logger.info(f"Timer server started for {rig_identifier}")
+    logger.info(f"Timer server started for {state.rig_identifier}")
 
     # Start Tkinter GUI in the main thread
-    logger.info(f"Starting Timer GUI for {rig_identifier}. Waiting for timer commands...")
+    logger.info(f"Starting Timer GUI for {state.rig_identifier}. Waiting for timer commands...")
     setup_gui()
 
 if __name__ == "__main__":
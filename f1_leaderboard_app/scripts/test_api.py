@@ -8,7 +8,8 @@ and then retrieving the leaderboard for verification.
 
 import sys
 import requests
-import time
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
 import traceback
 import logging
 
@@ -27,11 +28,16 @@ logger = logging.getLogger(__name__)
 API_HOST = "localhost"
 API_PORT = 8000
 API_BASE_URL = f"http://{API_HOST}:{API_PORT}"
+SUBMIT_WORKERS = 8
+
+# Shared session so every request reuses a keep-alive connection
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
 
 def test_api_connection():
     """Test basic API connectivity."""
     try:
-        response = requests.get(f"{API_BASE_URL}/api")
+        response = _SESSION.get(f"{API_BASE_URL}/api")
         logger.info(f"API connection test: {response.status_code}")
         logger.info(f"Response: {response.json()}")
         return response.status_code == 200
@@ -54,7 +60,7 @@ def submit_lap_time(rig_id, track_name, lap_time_ms):
     
     try:
         logger.info(f"Submitting lap time: {payload}")
-        response = requests.post(url, json=payload)
+        response = _SESSION.post(url, json=payload)
         logger.info(f"Response status: {response.status_code}")
         logger.info(f"Response: {response.json()}")
         return response.status_code == 200
@@ -72,7 +78,7 @@ def get_leaderboard(track_name):
     
     try:
         logger.info(f"Getting leaderboard for: {track_name}")
-        response = requests.get(url)
+        response = _SESSION.get(url)
         logger.info(f"Response status: {response.status_code}")
         leaderboard = response.json()
         logger.info(f"Leaderboard: {leaderboard}")
@@ -106,21 +112,20 @@ def main():
         
         rig_id = "RIG1"
         
-        # Submit multiple lap times for different tracks
-        for track in tracks:
-            # Submit 3 lap times per track
-            for i in range(3):
-                # Generate lap times between 85 and 95 seconds
-                lap_time_ms = 85000 + (i * 2000) + (1000 if i == 1 else 0)
-                
-                if not submit_lap_time(rig_id, track, lap_time_ms):
-                    logger.warning(f"Failed to submit lap time for {track}")
-                
-                # Wait a bit between submissions
-                time.sleep(0.5)
+        # Submit 3 lap times per track, generating lap times between 85 and 95 seconds
+        payloads = [
+            (rig_id, track, 85000 + (i * 2000) + (1000 if i == 1 else 0))
+            for track in tracks
+            for i in range(3)
+        ]
+        
+        # Submissions are independent, so send them concurrently
+        with ThreadPoolExecutor(max_workers=SUBMIT_WORKERS) as executor:
+            results = list(executor.map(lambda args: submit_lap_time(*args), payloads))
         
-        # Wait for any database operations to complete
-        time.sleep(1)
+        for (_, track, _), success in zip(payloads, results):
+            if not success:
+                logger.warning(f"Failed to submit lap time for {track}")
         
         # Get leaderboards for verification
         for track in tracks:
@@ -19,6 +19,7 @@ import json
 import logging
 import requests
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 
 # Add the project root to the Python path
 script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -38,12 +39,19 @@ logger = logging.getLogger(__name__)
 # Base URL for API
 API_BASE_URL = f"http://{API_HOST}:{API_PORT}/api"
 
-def get_current_leaderboard_data():
-    """Get the current leaderboard data."""
+# Shared session so every request reuses a keep-alive connection
+_SESSION = requests.Session()
+
+def get_current_leaderboard_data(pending=None):
+    """Get the current leaderboard data.
+    
+    Args:
+        pending (Future, optional): In-flight request to report on instead of fetching
+    """
     url = f"{API_BASE_URL}/display/current_leaderboard_data"
     
     try:
-        response = requests.get(url)
+        response = pending.result() if pending else _SESSION.get(url)
         if response.status_code == 200:
             data = response.json()
             track_name = data.get("track_name", "Unknown")
@@ -61,12 +69,16 @@ def get_current_leaderboard_data():
         logger.error(f"Exception: {e}")
         return None
 
-def get_track_status():
-    """Get the current track status."""
+def get_track_status(pending=None):
+    """Get the current track status.
+    
+    Args:
+        pending (Future, optional): In-flight request to report on instead of fetching
+    """
     url = f"{API_BASE_URL}/admin/track/status"
     
     try:
-        response = requests.get(url)
+        response = pending.result() if pending else _SESSION.get(url)
         if response.status_code == 200:
             data = response.json()
             logger.info(f"Track Status:")
@@ -86,13 +98,20 @@ def get_track_status():
         logger.error(f"Exception: {e}")
         return None
 
+def get_status():
+    """Fetch the leaderboard data and track status concurrently, then report both in order."""
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        leaderboard_pending = executor.submit(_SESSION.get, f"{API_BASE_URL}/display/current_leaderboard_data")
+        status_pending = executor.submit(_SESSION.get, f"{API_BASE_URL}/admin/track/status")
+        return get_current_leaderboard_data(leaderboard_pending), get_track_status(status_pending)
+
 def select_track(track_name):
     """Manually select a track."""
     url = f"{API_BASE_URL}/admin/track/select"
     
     try:
         data = {"track_name": track_name}
-        response = requests.post(url, json=data)
+        response = _SESSION.post(url, json=data)
         if response.status_code == 200:
             result = response.json()
             logger.info(f"Track selection result: {result.get('message', 'Unknown')}")
@@ -109,7 +128,7 @@ def toggle_autocycle():
     url = f"{API_BASE_URL}/admin/track/toggle_autocycle"
     
     try:
-        response = requests.post(url)
+        response = _SESSION.post(url)
         if response.status_code == 200:
             result = response.json()
             auto_cycle = result.get("auto_cycle_enabled", False)
@@ -245,8 +264,7 @@ def main():
     
     if args.test in ["all", "status"]:
         logger.info("\n=== Testing Current Status ===")
-        get_current_leaderboard_data()
-        get_track_status()
+        get_status()
     
     if args.test in ["all", "cycle"]:
         logger.info("\n=== Testing Auto-cycling ===")
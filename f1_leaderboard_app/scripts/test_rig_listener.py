@@ -35,6 +35,37 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# F1 packets have a header (29 bytes) followed by packet data. Every mock packet
+# shares the same header apart from the packet ID, so pack each header once.
+PACKET_HEADER_FORMAT = '<HBBBBQfIBB'
+PACKET_FORMAT = 2024  # F1 2024
+SESSION_UID = 12345678
+SECONDARY_PLAYER_INDEX = 255  # 255 = no secondary player
+
+def _pack_header(packet_id):
+    """Pack a mock packet header.
+    
+    Args:
+        packet_id (int): Packet ID (1 = session data, 2 = lap data)
+        
+    Returns:
+        bytes: Packed packet header
+    """
+    return struct.pack(
+        PACKET_HEADER_FORMAT,
+        PACKET_FORMAT, 1, 0, 1,  # game major/minor version, packet version
+        packet_id, SESSION_UID, 0.0, 0,  # session time, frame identifier
+        0, SECONDARY_PLAYER_INDEX  # player car index, secondary player index
+    )
+
+SESSION_HEADER = _pack_header(1)
+LAP_HEADER = _pack_header(2)
+
+# Pad packets with zeros to make them a realistic size
+SESSION_PADDING = b'\0' * 150
+LAP_DATA_SIZE = 1500
+CAR_DATA_SIZE = 50  # Assume each car data block is 50 bytes (simplified)
+
 def send_mock_session_data(sock, track_id):
     """Send mock session data packet with track information.
     
@@ -42,35 +73,8 @@ def send_mock_session_data(sock, track_id):
         sock (socket.socket): UDP socket
         track_id (int): Track ID to send
     """
-    # Create a more realistic mock packet that matches F1 telemetry format size
-    # F1 packets have a header (29 bytes) followed by packet data
-    
-    # Header (29 bytes)
-    packet_format = 2024  # F1 2024
-    game_major_version = 1
-    game_minor_version = 0
-    packet_version = 1
-    packet_id = 1  # Session data packet
-    session_uid = 12345678
-    session_time = 0.0
-    frame_identifier = 0
-    player_car_index = 0
-    secondary_player_index = 255  # 255 = no secondary player
-    
-    # Create header and add some minimal session data 
-    header = struct.pack(
-        '<HBBBBQfIBB',
-        packet_format, game_major_version, game_minor_version, packet_version,
-        packet_id, session_uid, session_time, frame_identifier,
-        player_car_index, secondary_player_index
-    )
-    
     # Add minimal mock session data (we just need the track ID)
-    # Pad the packet with zeros to make it a realistic size
-    session_data = struct.pack('<B', track_id) + b'\0' * 150
-    
-    # Combine header and data
-    data = header + session_data
+    data = SESSION_HEADER + struct.pack('<B', track_id) + SESSION_PADDING
     
     sock.sendto(data, ('127.0.0.1', DEFAULT_UDP_PORT))
     logger.info(f"Sent session data packet with track ID: {track_id}")
@@ -83,50 +87,23 @@ def send_mock_lap_data(sock, car_index, lap_time_ms):
         car_index (int): Car index (0 for player car)
         lap_time_ms (int): Lap time in milliseconds
     """
-    # Create a more realistic mock packet that matches F1 telemetry format size
-    # F1 packets have a header (29 bytes) followed by packet data
-    
-    # Header (29 bytes)
-    packet_format = 2024  # F1 2024
-    game_major_version = 1
-    game_minor_version = 0
-    packet_version = 1
-    packet_id = 2  # Lap data packet
-    session_uid = 12345678
-    session_time = 0.0
-    frame_identifier = 0
-    player_car_index = 0
-    secondary_player_index = 255  # 255 = no secondary player
-    
-    # Create header
-    header = struct.pack(
-        '<HBBBBQfIBB',
-        packet_format, game_major_version, game_minor_version, packet_version,
-        packet_id, session_uid, session_time, frame_identifier,
-        player_car_index, secondary_player_index
-    )
-    
     # Prepare lap data - we need to set the fields for a single car's lap data
     # We'll create a minimal representation with just the fields we need
     current_lap_invalid = 0  # 0 = valid lap
     last_lap_time_in_ms = lap_time_ms
-    current_lap_time_in_ms = 0  # completed lap
     
     # Add a dummy lap data entry for the specified car
     # Real packet has data for all cars but we only care about one
-    lap_data = bytearray(b'\0' * 1500)  # Pre-allocate with zeros
+    lap_data = bytearray(LAP_DATA_SIZE)  # Pre-allocate with zeros
     
     # Insert data for our target car at the appropriate offset
-    car_offset = car_index * 50  # Assume each car data block is 50 bytes (simplified)
+    car_offset = car_index * CAR_DATA_SIZE
     
     # Pack the last lap time at appropriate offset
     struct.pack_into('<fI', lap_data, car_offset, 0.0, last_lap_time_in_ms)
     struct.pack_into('<B', lap_data, car_offset + 30, current_lap_invalid)
     
-    # Combine header and data
-    data = header + lap_data
-    
-    sock.sendto(data, ('127.0.0.1', DEFAULT_UDP_PORT))
+    sock.sendto(LAP_HEADER + lap_data, ('127.0.0.1', DEFAULT_UDP_PORT))
     logger.info(f"Sent lap data packet - Car: {car_index}, Lap time: {lap_time_ms}ms")
 
 def main():
@@ -0,0 +1,13 @@
+-- Sync key for the F1 leaderboard sync (see SYNC_KEY_COLUMN in supabase_sync.py).
+-- Run once in the Supabase SQL editor; until it is applied the sync replaces all
+-- F1 rows on every run instead of upserting them.
+--
+-- The key lives in its own column rather than a constraint on the shared table's
+-- data columns: rows written by other simulators leave f1_sync_key NULL, and a
+-- unique constraint never treats NULLs as duplicates, so their writers (including
+-- ones that insert repeated laps) are unaffected. Existing rows are not modified;
+-- F1 rows without a key are replaced by the sync's next full refresh.
+ALTER TABLE leaderboard ADD COLUMN IF NOT EXISTS f1_sync_key text;
+
+ALTER TABLE leaderboard
+    ADD CONSTRAINT leaderboard_f1_sync_key UNIQUE (f1_sync_key);
@@ -3,16 +3,24 @@ F1 Leaderboard to Supabase Sync Service
 
 This service syncs F1 leaderboard data directly to the Supabase leaderboard table.
 Simple 1:1 mapping with contact info and rig tracking.
+
+Rows are upserted on a dedicated f1_sync_key column once
+supabase_leaderboard_upsert.sql has been applied; until then the service falls
+back to replacing all F1 rows (delete, then insert) on every sync. The key
+column stays NULL for other simulators' rows, so its unique constraint never
+affects their writers.
 """
 
 import os
 import sys
 import requests
+from requests.adapters import HTTPAdapter
 import asyncio
 import logging
+from collections import Counter, defaultdict
+from operator import itemgetter
 from datetime import datetime
 from typing import List, Dict, Optional
-import json
 
 # Add the project root to the Python path
 root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
@@ -20,6 +28,7 @@ sys.path.append(root_dir)
 
 try:
     from config.app_config import F1_2024_TRACKS
+    from config.utils import format_lap_time, json_dumps
     from backend.database.db_manager import get_all_lap_times_detailed, get_rig_assignments
 except ImportError as e:
     print(f"Import error: {e}")
@@ -47,6 +56,23 @@ SUPABASE_ANON_KEY = env_vars.get('SUPABASE_ANON_KEY', 'your-anon-key')
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Upload requests in flight at once; also sizes the connection pool
+SYNC_CONCURRENCY = 4
+
+# Shared session so each sync reuses a keep-alive TLS connection to Supabase
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=SYNC_CONCURRENCY, pool_maxsize=SYNC_CONCURRENCY, max_retries=3))
+
+# Rows per upload request; keeps each PostgREST payload and statement bounded
+SYNC_CHUNK_SIZE = 500
+
+# Columns identifying an F1 leaderboard row
+LEADERBOARD_KEY_COLUMNS = ('player_name', 'track_name', 'rig_identifier', 'lap_time_ms', 'simulator_type')
+
+# Unique column holding the joined key of each synced F1 row (see supabase_leaderboard_upsert.sql)
+SYNC_KEY_COLUMN = 'f1_sync_key'
+SYNC_KEY_SEPARATOR = '\x1f'  # ASCII unit separator, never part of a name
+
 class F1SupabaseSync:
     def __init__(self):
         self.supabase_url = SUPABASE_URL
@@ -56,28 +82,125 @@ class F1SupabaseSync:
             'Authorization': f'Bearer {self.anon_key}',
             'Content-Type': 'application/json'
         }
+        # return=minimal stops Supabase echoing every row back; upserts also update
+        # rows that already exist instead of failing on them
+        self.insert_headers = {**self.headers, 'Prefer': 'return=minimal'}
+        self.upsert_headers = {**self.headers, 'Prefer': 'resolution=merge-duplicates,return=minimal'}
+        # Row keys sent by the last successful sync; None until one completes
+        self._last_keys = None
+        # Whether the table has the sync key column; None until checked
+        self._sync_key_column = None
+        # Whether the sync key column is unique so upserts work; None until tried
+        self._upsert_supported = None
 
     def format_lap_time(self, lap_time_ms: int) -> str:
         """Format lap time from milliseconds to MM:SS.mmm display format."""
-        if lap_time_ms <= 0:
-            return "00:00.000"
+        return format_lap_time(lap_time_ms)
+
+    def get_contact_info_by_player(self, rig_assignments: List[Dict]) -> Dict[str, Dict[str, str]]:
+        """Map each currently assigned player to their contact info.
+
+        Args:
+            rig_assignments: Rig assignment rows from get_rig_assignments()
+
+        Returns:
+            dict: Player name -> {'phone_number', 'email'}; the first rig wins if a
+            player is assigned to several
+        """
+        contact_info_by_player = {}
+        for rig in rig_assignments:
+            contact_info_by_player.setdefault(rig['current_player_name'], {
+                'phone_number': rig.get('phone_number', ''),
+                'email': rig.get('email', '')
+            })
+        return contact_info_by_player
+
+    def has_sync_key_column(self) -> Optional[bool]:
+        """Check whether the leaderboard table has the sync key column.
+
+        Returns:
+            bool: True if it exists, False if it doesn't, None if the check failed
+        """
+        try:
+            response = _SESSION.get(
+                f"{self.supabase_url}/rest/v1/leaderboard",
+                headers=self.headers,
+                params={'select': SYNC_KEY_COLUMN, 'limit': '0'}
+            )
+        except requests.RequestException as e:
+            logger.warning(f"Could not check for the {SYNC_KEY_COLUMN} column: {e}")
+            return None
         
-        total_seconds = lap_time_ms / 1000
-        minutes = int(total_seconds // 60)
-        seconds = int(total_seconds % 60)
-        milliseconds = int((total_seconds - int(total_seconds)) * 1000)
+        if response.status_code == 200:
+            return True
+        if response.status_code == 400:  # Unknown column
+            logger.warning(f"Leaderboard table has no {SYNC_KEY_COLUMN} column (see supabase_leaderboard_upsert.sql); "
+                           "replacing all F1 rows on every sync")
+            return False
+        logger.warning(f"Could not check for the {SYNC_KEY_COLUMN} column: HTTP {response.status_code}")
+        return None
+
+    async def upload_chunk(self, start: int, chunk: List[Dict], semaphore: asyncio.Semaphore, upsert: bool) -> bool:
+        """Insert or upsert one chunk of leaderboard entries without blocking the event loop.
+
+        Args:
+            start: Index of the chunk's first entry, for logging
+            chunk: Leaderboard entries to send
+            semaphore: Limits how many chunks are in flight at once
+            upsert: Merge into existing rows instead of plain inserts
+
+        Returns:
+            bool: True if Supabase accepted the chunk
+        """
+        async with semaphore:
+            # requests is blocking, so send from a worker thread over the pooled session
+            # (pre-encoded; self.headers already sets the JSON content type)
+            insert_response = await asyncio.to_thread(
+                _SESSION.post,
+                f"{self.supabase_url}/rest/v1/leaderboard",
+                headers=self.upsert_headers if upsert else self.insert_headers,
+                params={'on_conflict': SYNC_KEY_COLUMN} if upsert else None,
+                data=json_dumps(chunk)
+            )
         
-        return f"{minutes:02d}:{seconds:02d}.{milliseconds:03d}"
+        if insert_response.status_code in [200, 201]:
+            if upsert:
+                self._upsert_supported = True
+            logger.info(f"Uploaded entries {start + 1}-{start + len(chunk)}")
+            return True
+        
+        # 42P10: no unique constraint matches on_conflict, so upserts can never work
+        if upsert and '42P10' in insert_response.text:
+            if self._upsert_supported is not False:
+                logger.warning(f"{SYNC_KEY_COLUMN} has no unique constraint (see supabase_leaderboard_upsert.sql); "
+                               "falling back to delete-then-insert")
+            self._upsert_supported = False
+            return False
+        
+        logger.error(f"Failed to upload entries {start + 1}-{start + len(chunk)}: {insert_response.status_code}")
+        logger.error(f"Response: {insert_response.text}")
+        return False
 
-    def get_contact_info_for_player(self, player_name: str, rig_assignments: List[Dict]) -> Dict[str, str]:
-        """Get contact info for a player based on current rig assignments."""
-        for rig in rig_assignments:
-            if rig['current_player_name'] == player_name:
-                return {
-                    'phone_number': rig.get('phone_number', ''),
-                    'email': rig.get('email', '')
-                }
-        return {'phone_number': '', 'email': ''}
+    async def upload_entries(self, entries: List[Dict], upsert: bool) -> int:
+        """Send leaderboard entries in concurrent chunks so one failed request doesn't lose the rest.
+
+        Args:
+            entries: Leaderboard entries to send
+            upsert: Merge into existing rows instead of plain inserts
+
+        Returns:
+            int: Number of entries Supabase rejected
+        """
+        semaphore = asyncio.Semaphore(SYNC_CONCURRENCY)
+        starts = range(0, len(entries), SYNC_CHUNK_SIZE)
+        results = await asyncio.gather(*(
+            self.upload_chunk(start, entries[start:start + SYNC_CHUNK_SIZE], semaphore, upsert)
+            for start in starts
+        ))
+        return sum(
+            len(entries[start:start + SYNC_CHUNK_SIZE])
+            for start, ok in zip(starts, results) if not ok
+        )
 
     async def sync_all_leaderboard_data(self):
         """Sync all F1 leaderboard data to Supabase."""
@@ -85,45 +208,29 @@ class F1SupabaseSync:
         
         try:
             # Get all F1 lap times
-            f1_lap_times = get_all_lap_times_detailed()
+            f1_lap_times = await asyncio.to_thread(get_all_lap_times_detailed)
             if not f1_lap_times:
                 logger.info("No F1 lap times found")
                 return
             
-            # Get current rig assignments for contact info
-            rig_assignments = get_rig_assignments()
-            
-            # Clear existing leaderboard data
-            logger.info("Clearing existing leaderboard data...")
-            delete_response = requests.delete(
-                f"{self.supabase_url}/rest/v1/leaderboard",
-                headers=self.headers,
-                params={'simulator_type': 'eq.F1 Live'}
-            )
-            
-            if delete_response.status_code not in [200, 204]:
-                logger.warning(f"Failed to clear existing data: {delete_response.status_code}")
+            # Get current rig assignments for contact info, indexed by player
+            contact_info_by_player = self.get_contact_info_by_player(await asyncio.to_thread(get_rig_assignments))
+            no_contact_info = {'phone_number': '', 'email': ''}
             
             # Group lap times by track and calculate positions
-            tracks_data = {}
+            tracks_data = defaultdict(list)
             for lap_time in f1_lap_times:
-                track_name = lap_time['track_name']
-                if track_name not in tracks_data:
-                    tracks_data[track_name] = []
-                tracks_data[track_name].append(lap_time)
+                tracks_data[lap_time['track_name']].append(lap_time)
             
             # Sort each track's data and assign positions
             all_entries = []
             for track_name, track_lap_times in tracks_data.items():
                 # Sort by lap time (best first)
-                track_lap_times.sort(key=lambda x: x['lap_time_ms'])
+                track_lap_times.sort(key=itemgetter('lap_time_ms'))
                 
                 for position, lap_time in enumerate(track_lap_times, 1):
                     # Get contact info for this player
-                    contact_info = self.get_contact_info_for_player(
-                        lap_time['player_name'], 
-                        rig_assignments
-                    )
+                    contact_info = contact_info_by_player.get(lap_time['player_name'], no_contact_info)
                     
                     # Format entry for Supabase
                     entry = {
@@ -144,28 +251,64 @@ class F1SupabaseSync:
                 logger.info("No entries to sync")
                 return
             
-            # Insert all entries
-            logger.info(f"Inserting {len(all_entries)} leaderboard entries...")
-            insert_response = requests.post(
-                f"{self.supabase_url}/rest/v1/leaderboard",
-                headers=self.headers,
-                json=all_entries
-            )
+            # A batch may not touch the same row twice, so drop duplicate keys
+            current_keys = set()
+            unique_entries = []
+            for entry in all_entries:
+                key = tuple(entry[column] for column in LEADERBOARD_KEY_COLUMNS)
+                if key not in current_keys:
+                    current_keys.add(key)
+                    unique_entries.append(entry)
+            all_entries = unique_entries
+            
+            # Rows carry the sync key whenever the table has the column, so rows
+            # inserted before the first upsert can be matched by later ones
+            if self._sync_key_column is None:
+                self._sync_key_column = await asyncio.to_thread(self.has_sync_key_column)
+            if self._sync_key_column:
+                for entry in all_entries:
+                    entry[SYNC_KEY_COLUMN] = SYNC_KEY_SEPARATOR.join(
+                        str(entry[column]) for column in LEADERBOARD_KEY_COLUMNS)
             
-            if insert_response.status_code == 201:
+            # Upserting leaves unchanged rows alone and deletes nothing, so it is only
+            # used when the table holds no rows we no longer have (i.e. not on the
+            # first sync or after laps were removed locally) and the key column and
+            # its constraint are not known to be missing
+            upserted = False
+            if (self._sync_key_column and self._upsert_supported is not False and self._last_keys is not None
+                    and self._last_keys <= current_keys):
+                logger.info(f"Upserting {len(all_entries)} leaderboard entries...")
+                failed_entries = await self.upload_entries(all_entries, upsert=True)
+                upserted = self._upsert_supported is not False
+            
+            if not upserted:
+                # Replace all F1 rows: clear them, then insert the full leaderboard
+                logger.info("Clearing existing leaderboard data...")
+                delete_response = await asyncio.to_thread(
+                    _SESSION.delete,
+                    f"{self.supabase_url}/rest/v1/leaderboard",
+                    headers=self.headers,
+                    params={'simulator_type': 'eq.F1 Live'}
+                )
+                
+                if delete_response.status_code not in [200, 204]:
+                    logger.warning(f"Failed to clear existing data: {delete_response.status_code}")
+                
+                logger.info(f"Inserting {len(all_entries)} leaderboard entries...")
+                failed_entries = await self.upload_entries(all_entries, upsert=False)
+            
+            if not failed_entries:
+                self._last_keys = current_keys
                 logger.info(f"Successfully synced {len(all_entries)} leaderboard entries!")
                 
                 # Log summary by track
-                track_counts = {}
-                for entry in all_entries:
-                    track_name = entry['track_name']
-                    track_counts[track_name] = track_counts.get(track_name, 0) + 1
+                track_counts = Counter(entry['track_name'] for entry in all_entries)
                 
                 for track_name, count in track_counts.items():
                     logger.info(f"  - {track_name}: {count} entries")
             else:
-                logger.error(f"Failed to insert leaderboard entries: {insert_response.status_code}")
-                logger.error(f"Response: {insert_response.text}")
+                self._last_keys = None  # Table state unknown; clear it on the next sync
+                logger.error(f"Failed to upload {failed_entries} of {len(all_entries)} leaderboard entries")
                 
         except Exception as e:
             logger.error(f"Error in sync: {e}")
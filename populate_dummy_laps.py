@@ -12,7 +12,7 @@ root_dir = os.path.abspath(os.path.dirname(__file__))
 sys.path.append(os.path.join(root_dir, "f1_leaderboard_app"))
 
 try:
-    from backend.database.db_manager import add_lap_time, initialize_database, get_rig_id, get_track_id
+    from backend.database.db_manager import bulk_add_lap_times, initialize_database, get_rig_id, get_track_id
     from config.app_config import F1_2024_TRACKS # To ensure track name is valid
 except ImportError as e:
     print(f"Error importing necessary modules: {e}")
@@ -38,7 +38,7 @@ def populate_laps():
     except Exception as e:
         print(f"Error during database initialization: {e}")
         # Depending on the error, we might not want to proceed
-        # For now, we'll try to continue as add_lap_time has its own checks
+        # For now, we'll try to continue as bulk_add_lap_times has its own checks
 
     # Verify that the target track and rig exist
     if track_to_populate not in F1_2024_TRACKS:
@@ -55,25 +55,20 @@ def populate_laps():
         return
 
     print(f"Proceeding to add {num_laps} lap times...")
-    laps_added_count = 0
-    for i in range(1, num_laps + 1):
+    rows = []
+    # Lap times between 1:28.000 and 1:35.999
+    # 88,000 ms to 95,999 ms, drawn for every lap at once
+    lap_times_ms = random.choices(range(88000, 96000), k=num_laps)
+    for i, lap_time_ms in enumerate(lap_times_ms, 1):
         player_name = f"Dummy Player {i:02d}"
-        # Lap times between 1:28.000 and 1:35.000
-        # 88,000 ms to 95,000 ms
-        base_lap_time_ms = 88000 
-        lap_time_ms = base_lap_time_ms + random.randint(0, 7000) + random.randint(0, 999)
         
         print(f"Adding lap: Player='{player_name}', Track='{track_to_populate}', Rig='{rig_identifier_for_laps}', Time='{lap_time_ms}ms'")
-        success = add_lap_time(
-            rig_identifier=rig_identifier_for_laps,
-            track_name=track_to_populate,
-            player_name=player_name,
-            lap_time_ms=lap_time_ms
-        )
-        if success:
-            laps_added_count +=1
-        else:
-            print(f"Failed to add lap for {player_name}. Check logs for details.")
+        rows.append((rig_identifier_for_laps, track_to_populate, player_name, lap_time_ms))
+
+    # Insert every lap in one transaction instead of one commit per lap
+    laps_added_count = len(bulk_add_lap_times(rows))
+    if laps_added_count < num_laps:
+        print(f"Failed to add {num_laps - laps_added_count} laps. Check logs for details.")
 
     print(f"\nFinished populating dummy laps. Successfully added {laps_added_count}/{num_laps} laps.")
 